@@ -15,131 +15,314 @@ monitoring.
 
 from __future__ import annotations
 
+from . import blender_util
 import bpy
+import ctypes
 import importlib
+import os
+import queue
+import re
+import struct
 import sys
+import threading
 import time
 import traceback
-from importlib.abc import MetaPathFinder
-from importlib.machinery import ModuleSpec
 from pathlib import Path
-from types import ModuleType, TracebackType
-from typing import Dict, List, Optional, Sequence, Set, Tuple, Type
+from types import CodeType
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 
 _instance: Optional[MonitorOperatorBase] = None
 
-
-class ImportTracker(MetaPathFinder):
+# inotify event flags, from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+
+# On Windows os.scandir() returns the stat information for each entry as part
+# of the directory listing, so listing each directory is much cheaper than
+# calling stat() on each file.  Elsewhere DirEntry.stat() still has to call
+# stat() for each file, so there is no benefit to listing the directories.
+_USE_SCANDIR: bool = sys.platform == "win32"
+
+# Filesystem types on which inotify does not report changes made by other
+# hosts, and where stat() calls are comparatively expensive.
+_NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smbfs", "smb3"})
+
+
+def _read_mounts() -> List[Tuple[str, str]]:
+    """Return a list of (mount point, filesystem type) tuples.
+
+    The list is sorted with the longest mount points first, so the first
+    entry that contains a given path is the mount that path resides on.
+    Returns an empty list if the mount table is not available.
     """
-    A helper class to monitor imports that happen, so we can keep track
-    of which modules we need to monitor.
+    try:
+        with open("/proc/mounts", "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+
+    mounts: List[Tuple[str, str]] = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Whitespace in mount points is escaped as octal sequences
+        mount_point = re.sub(
+            r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[1]
+        )
+        mounts.append((mount_point, fields[2]))
+
+    mounts.sort(key=lambda entry: len(entry[0]), reverse=True)
+    return mounts
 
-    This hooks into the import system so we can record modules we attempt to
-    import even if an error occurs while importing them.
+
+def _is_network_path(path: Path, mounts: List[Tuple[str, str]]) -> bool:
+    path_str = str(path)
+    for mount_point, fs_type in mounts:
+        if path_str == mount_point or path_str.startswith(
+            mount_point.rstrip("/") + "/"
+        ):
+            return fs_type in _NETWORK_FS_TYPES
+    return False
+
+
+class _FSNotifier:
+    """
+    A helper class to detect changes to monitored files using Linux's inotify
+    API, so that we do not have to stat() every monitored file on every timer
+    tick.
+
+    inotify watches directories rather than individual files, so this watches
+    each directory containing a monitored file, and then filters the events
+    down to just the file names that we care about.  Any paths that cannot be
+    watched (e.g., because their parent directory does not exist) are returned
+    from set_paths() so that the caller can fall back to polling them.
     """
 
-    def __init__(self) -> None:
-        self.real_meta_path: Optional[List[MetaPathFinder]] = None
-        self.imported_modules: Dict[str, List[Path]] = {}
+    _event_header = struct.Struct("iIII")
+    _watch_mask: int = (
+        _IN_MODIFY
+        | _IN_ATTRIB
+        | _IN_CREATE
+        | _IN_DELETE
+        | _IN_MOVED_FROM
+        | _IN_MOVED_TO
+    )
 
-    def __enter__(self) -> ImportTracker:
-        self.install()
-        return self
+    def __init__(self, libc: ctypes.CDLL, fd: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._watches: Dict[Path, int] = {}
+        self._names: Dict[int, Set[str]] = {}
 
-    def __exit__(
-        self,
-        exc_type: Optional[Type[BaseException]],
-        exc_value: Optional[BaseException],
-        traceback: Optional[TracebackType],
-    ) -> None:
-        self.uninstall()
-
-    def install(self) -> None:
-        assert not self.real_meta_path
-        # pyre-ignore[8]: typeshed defines sys.meta_path using a protocol
-        #   rather than MetaPathFinder, and has annoying inconsistencies
-        #   between its protocol and the real type.
-        self.real_meta_path = sys.meta_path
-        sys.meta_path = [self]
-
-    def uninstall(self) -> None:
-        meta_path = self.real_meta_path
-        assert meta_path is not None
-        # pyre-ignore[9]: same typeshed sys.meta_path problems as above.
-        sys.meta_path = meta_path
-        self.real_meta_path = None
-
-    def find_spec(
-        self,
-        fullname: str,
-        path: Optional[Sequence[str]],
-        target: Optional[ModuleType] = None,
-    ) -> Optional[ModuleSpec]:
-        meta_path = self.real_meta_path
-        assert meta_path is not None
-        for mpf in meta_path:
-            spec = mpf.find_spec(fullname, path, target)
-            if spec is not None:
-                paths: List[Path] = []
-                if spec.origin is not None:
-                    paths.append(Path(spec.origin))
-                self.imported_modules[fullname] = paths
-                return spec
-
-        # If we reach here we failed to find this module.
-        # Even though we could not find it, monitor the path were it is likely
-        # to be.  We want to immediately reload if this file does get created
-        # in the future.
-        if path:
-            search_path = path
-        else:
-            # If this is a top-level, walk through sys.path and add possible
-            # locations where it might not be found.  This might not be 100%
-            # accurate with what the real MetaPathFinders would do, but is good
-            # enough for most cases.
-            search_path = sys.path
-        module_base = fullname.rsplit(".", 1)[-1]
-        paths: List[Path] = []
-        for p in search_path:
-            paths.append(Path(p) / f"{module_base}.py")
-            paths.append(Path(p) / module_base / "__init__.py")
-        print(f"unable to find import: {fullname} ; will search {paths}")
-        self.imported_modules[fullname] = paths
+    @classmethod
+    def available(cls) -> bool:
+        return sys.platform.startswith("linux")
 
-        return None
+    @classmethod
+    def create(cls) -> Optional[_FSNotifier]:
+        """Create a new _FSNotifier.
+
+        Returns None if inotify is not supported on this platform.
+        """
+        if not cls.available():
+            return None
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError):
+            return None
 
-    def invalidate_caches(self) -> None:
-        meta_path = self.real_meta_path
-        assert meta_path is not None
-        for mpf in meta_path:
-            mpf.invalidate_caches()
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+        self._names.clear()
+
+    def set_paths(self, paths: Iterable[Path]) -> List[Path]:
+        """Update the set of files being watched.
+
+        Returns the list of paths that could not be watched.
+        """
+        names_by_dir: Dict[Path, Set[str]] = {}
+        for path in paths:
+            names_by_dir.setdefault(path.parent, set()).add(path.name)
+
+        for dir_path, wd in list(self._watches.items()):
+            if dir_path not in names_by_dir:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[dir_path]
+                self._names.pop(wd, None)
+
+        unwatched: List[Path] = []
+        for dir_path, names in names_by_dir.items():
+            wd = self._watches.get(dir_path)
+            if wd is None:
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(dir_path), self._watch_mask
+                )
+                if wd < 0:
+                    unwatched.extend(dir_path / name for name in names)
+                    continue
+                self._watches[dir_path] = wd
+            self._names[wd] = names
+
+        return unwatched
+
+    def read_events(self) -> bool:
+        """Consume all pending events without blocking.
+
+        Returns True if any of the events refer to a monitored file.
+        """
+        changed = False
+        header = self._event_header
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, name_len = header.unpack_from(buf, offset)
+                offset += header.size
+                name = buf[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    # We lost events, so we have to assume something changed
+                    changed = True
+                elif mask & _IN_IGNORED:
+                    # The watch was removed, most likely because the
+                    # directory itself was deleted.  Ignore events for watches
+                    # that we removed ourselves in set_paths().
+                    if self._names.pop(wd, None) is not None:
+                        changed = True
+                        for dir_path, dir_wd in list(self._watches.items()):
+                            if dir_wd == wd:
+                                del self._watches[dir_path]
+                elif os.fsdecode(name) in self._names.get(wd, ()):
+                    changed = True
 
 
 class MonitorOperatorBase(bpy.types.Operator):
     """Monitor an external script for changes and re-run on change"""
 
     # pyre-fixme[31]: bpy property types aren't really types
-    poll_interval: bpy.props.FloatProperty(name="poll_interval", default=0.1)
+    poll_interval: bpy.props.FloatProperty(name="poll_interval", default=0.5)
+
+    # The poll interval to use instead if some monitored files are on a
+    # network filesystem, and poll_interval was not explicitly specified.
+    # pyre-fixme[31]: bpy property types aren't really types
+    network_poll_interval: bpy.props.FloatProperty(
+        name="network_poll_interval", default=5.0
+    )
 
     # pyre-fixme[31]: bpy property types aren't really types
     delete_all: bpy.props.BoolProperty(name="delete_all", default=True)
 
+    # After detecting a change, wait until the files have stopped changing for
+    # debounce_interval seconds before re-running.  Editors that save by
+    # writing a temporary file and renaming it, or a "git checkout" touching
+    # many files, will otherwise trigger several back-to-back runs, some of
+    # which may see partially written files.  max_debounce bounds how long we
+    # will wait if the files keep changing.
+    # pyre-fixme[31]: bpy property types aren't really types
+    debounce_interval: bpy.props.FloatProperty(
+        name="debounce_interval", default=0.15
+    )
+    # pyre-fixme[31]: bpy property types aren't really types
+    max_debounce: bpy.props.FloatProperty(name="max_debounce", default=1.0)
+
+    # Run the monitored code in a background thread, so that the Blender UI
+    # stays responsive while it runs.  The Blender API is not thread-safe, so
+    # all bpy calls must stay on the main thread: this should only be used if
+    # the monitored code is pure Python computation that does not touch bpy.
+    # The scene is still cleared on the main thread before each run when
+    # delete_all is set, and cancelling waits for a running worker to finish.
+    # pyre-fixme[31]: bpy property types aren't really types
+    run_in_background: bpy.props.BoolProperty(
+        name="run_in_background", default=False
+    )
+
     # This is really a list, but blender does not appear to support passing
     # CollectionProperty values to operators when invoking them, so we pass it
     # as a comma-separated string.
     # pyre-fixme[31]: bpy property types aren't really types
     monitored_packages: bpy.props.StringProperty(name="monitored_packages")
     _monitored_packages: List[str] = []
+    # The package names, plus the package names with a trailing ".", for
+    # quickly checking if a module name falls in one of the packages.
+    _package_names: FrozenSet[str] = frozenset()
+    _package_prefixes: Tuple[str, ...] = ()
 
     # The REGISTER option allows our messages to be logged to the info console
     bl_options = {"REGISTER"}
 
     _timer: Optional[bpy.types.Timer] = None
+    # The interval _timer was created with, and where it was registered.
+    # The timer is re-created if the interval needs to change.
+    _timer_interval: float = 0.0
+    _window_manager: Optional[bpy.types.WindowManager] = None
+    _window: Optional[bpy.types.Window] = None
     stop: bool = False
 
     _monitored_modules: Dict[str, List[Path]] = {}
-    _timestamps: Dict[Path, Optional[float]] = {}
+    # When an _FSNotifier is available, _poll_paths only contains the paths
+    # that it was unable to watch.  Otherwise it contains all monitored paths.
+    # These are stored as strings since they are stat'ed on every timer tick,
+    # and _timestamps holds their modification times in the same order.
+    _notifier: Optional[_FSNotifier] = None
+    _poll_paths: List[str] = []
+    # The polled paths grouped by parent directory, as a list of
+    # (directory, {file name: index in _poll_paths}) tuples.
+    _poll_dirs: List[Tuple[str, Dict[str, int]]] = []
+    _mounts: List[Tuple[str, str]] = []
+    _has_network_paths: bool = False
+    _timestamps: Tuple[Optional[float], ...] = ()
+    # The time when we first saw a change that has not been processed yet,
+    # and the time of the most recent change.
+    _pending_since: Optional[float] = None
+    _last_change: float = 0.0
+    # Whether the last run failed or any monitored file was missing.  If not,
+    # no files have been added that the import system's caches could be
+    # missing, so there is no need to invalidate them before re-running.
+    _had_missing_files: bool = True
+    # The thread running the monitored code when run_in_background is set,
+    # and the queue it reports its result on.  The result is a
+    # (duration, exception, formatted traceback) tuple.
+    _worker: Optional[threading.Thread] = None
+    _results: Optional[
+        queue.Queue[Tuple[float, Optional[Exception], str]]
+    ] = None
     _name: str = ""
 
     @classmethod
@@ -160,6 +343,8 @@ class MonitorOperatorBase(bpy.types.Operator):
             self.report({"INFO"}, f"cancelling monitoring of {self._name}")
             return {"CANCELLED"}
 
+        if self._worker is not None:
+            self._check_worker()
         self.check_for_updates()
         return {"PASS_THROUGH"}
 
@@ -170,63 +355,300 @@ class MonitorOperatorBase(bpy.types.Operator):
             return {"CANCELLED"}
         _instance = self
 
-        self._monitored_packages = self.monitored_packages.split(",")
+        self._notifier = _FSNotifier.create()
+        self._mounts = _read_mounts()
 
+        # _init() may fill in a default value for monitored_packages, so
+        # parse it afterwards.
         self._init()
+        self._monitored_packages = [
+            pkg for pkg in self.monitored_packages.split(",") if pkg
+        ]
+        self._package_names = frozenset(self._monitored_packages)
+        self._package_prefixes = tuple(
+            pkg + "." for pkg in self._monitored_packages
+        )
         self.report({"INFO"}, f"monitoring modules for {self._name}")
+        self._window_manager = context.window_manager
+        self._window = context.window
         self._init_monitored_modules()
         self.on_change()
 
-        wm = context.window_manager
-        self._timer = wm.event_timer_add(
-            self.poll_interval, window=context.window
-        )
-        wm.modal_handler_add(self)
+        # on_change() normally creates the timer when it refreshes the
+        # monitored modules, but not if the first run is in the background.
+        self._update_timer()
+        context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
+    def _update_timer(self) -> None:
+        """Create the timer, or re-create it if the poll interval changed.
+
+        The interval depends on whether any monitored files are on a network
+        filesystem, which can change each time the monitored modules are
+        refreshed.
+        """
+        poll_interval = self.poll_interval
+        if self._has_network_paths and not self.properties.is_property_set(
+            "poll_interval"
+        ):
+            poll_interval = self.network_poll_interval
+
+        timer = self._timer
+        if timer is not None and poll_interval == self._timer_interval:
+            return
+        wm = self._window_manager
+        assert wm is not None
+        if timer is not None:
+            wm.event_timer_remove(timer)
+        self._timer = wm.event_timer_add(poll_interval, window=self._window)
+        self._timer_interval = poll_interval
+
     def _refresh_monitored_modules(
-        self, import_tracker: ImportTracker
+        self, failed_modules: Optional[Dict[str, List[Path]]] = None
     ) -> None:
-        monitored_modules: Dict[str, List[Path]] = {}
-        for mod_name, paths in import_tracker.imported_modules.items():
-            paths_to_monitor = self._get_monitor_paths(mod_name, paths)
-            if paths_to_monitor:
-                monitored_modules[mod_name] = paths_to_monitor
+        monitored_modules = self._find_monitored_modules()
+        if failed_modules is not None:
+            # If the run failed, some modules may not have been imported this
+            # time.  Keep monitoring everything we were monitoring before.
+            for mod_name, paths in self._monitored_modules.items():
+                monitored_modules.setdefault(mod_name, paths)
+            for mod_name, paths in failed_modules.items():
+                paths_to_monitor = self._get_monitor_paths(mod_name, paths)
+                if paths_to_monitor:
+                    monitored_modules[mod_name] = paths_to_monitor
 
         self._monitored_modules = monitored_modules
+        self._update_poll_paths()
         self._timestamps = self._get_timestamps()
+        self._had_missing_files = (
+            failed_modules is not None or None in self._timestamps
+        )
+        self._update_timer()
+
+    def _update_poll_paths(self) -> None:
+        # The same file can be listed under several module names, e.g. a
+        # script that failed when run as __main__ and was also imported by
+        # name.  Remove duplicates, keeping the first-seen order.
+        all_paths = list(
+            dict.fromkeys(
+                path
+                for path_list in self._monitored_modules.values()
+                for path in path_list
+            )
+        )
+        # inotify does not see changes made to network filesystems by other
+        # hosts, so always poll files on network filesystems.
+        network_paths = [
+            path for path in all_paths if _is_network_path(path, self._mounts)
+        ]
+        self._has_network_paths = bool(network_paths)
+
+        notifier = self._notifier
+        if notifier is not None:
+            network_path_set = set(network_paths)
+            local_paths = [
+                path for path in all_paths if path not in network_path_set
+            ]
+            all_paths = notifier.set_paths(local_paths) + network_paths
+        self._poll_paths = [str(path) for path in all_paths]
+
+        poll_dirs: Dict[str, Dict[str, int]] = {}
+        for idx, path in enumerate(all_paths):
+            poll_dirs.setdefault(str(path.parent), {})[path.name] = idx
+        self._poll_dirs = list(poll_dirs.items())
 
     def _init_monitored_modules(self) -> None:
-        for mod_name, module in sys.modules.items():
-            mod_path_str = getattr(module, "__file__", None)
+        self._monitored_modules = self._find_monitored_modules()
+
+    def _find_monitored_modules(self) -> Dict[str, List[Path]]:
+        """Find all currently loaded modules that should be monitored.
+
+        This is called after each run to pick up whatever modules the run
+        imported.  Namespace packages have no __file__ and are skipped, but
+        the modules imported from them are still found individually.
+        """
+        monitored_modules: Dict[str, List[Path]] = {}
+        _getattr = getattr
+        # When monitoring specific packages, skip everything else by name
+        # before looking up __file__ and building Path objects.  Most of
+        # sys.modules is the standard library and Blender's own modules.
+        package_names = self._package_names
+        package_prefixes = self._package_prefixes
+        for mod_name, module in list(sys.modules.items()):
+            if (
+                package_names
+                and mod_name not in package_names
+                and not mod_name.startswith(package_prefixes)
+            ):
+                continue
+            mod_path_str = _getattr(module, "__file__", None)
             mod_paths: List[Path] = []
             if mod_path_str is not None:
                 mod_paths.append(Path(mod_path_str))
             paths_to_monitor = self._get_monitor_paths(mod_name, mod_paths)
             if paths_to_monitor:
-                self._monitored_modules[mod_name] = paths_to_monitor
+                monitored_modules[mod_name] = paths_to_monitor
+        return monitored_modules
+
+    def _get_failed_module_paths(
+        self, ex: BaseException
+    ) -> Dict[str, List[Path]]:
+        """Return the paths of modules involved in a failed run.
+
+        Modules that fail to import are removed from sys.modules, so we would
+        otherwise not notice them when scanning sys.modules.  This returns the
+        files that appear in the exception's traceback, the file that failed
+        to parse if this was a SyntaxError, and the paths where a missing
+        module would likely be found if it was a ModuleNotFoundError.
+        Monitoring these lets us immediately re-run once the problem is fixed.
+        """
+        result: Dict[str, List[Path]] = {}
+        cur_ex: Optional[BaseException] = ex
+        while cur_ex is not None:
+            tb = cur_ex.__traceback__
+            while tb is not None:
+                frame_globals = tb.tb_frame.f_globals
+                tb = tb.tb_next
+                mod_name = frame_globals.get("__name__")
+                mod_file = frame_globals.get("__file__")
+                if not isinstance(mod_name, str) or not isinstance(
+                    mod_file, str
+                ):
+                    continue
+                # Monitored module names are removed from sys.modules before
+                # each run, so never record a frame whose name refers to a
+                # different module.  In particular, ScriptMonitorOperator runs
+                # its script as "__main__", and removing the interpreter's
+                # real __main__ module would break it.  Modules that failed
+                # to import are no longer in sys.modules, and are recorded so
+                # that we re-run once they are fixed.
+                if mod_name == "__main__":
+                    continue
+                module = sys.modules.get(mod_name)
+                if module is not None and (
+                    getattr(module, "__dict__", None) is not frame_globals
+                ):
+                    continue
+                result[mod_name] = [Path(mod_file)]
+
+            if isinstance(cur_ex, SyntaxError) and cur_ex.filename:
+                syntax_path = Path(cur_ex.filename)
+                mod_name = self._guess_module_name(syntax_path)
+                if mod_name is not None:
+                    result[mod_name] = [syntax_path]
+            elif isinstance(cur_ex, ModuleNotFoundError) and cur_ex.name:
+                fullname = cur_ex.name
+                parent_name, _, module_base = fullname.rpartition(".")
+                if parent_name:
+                    parent = sys.modules.get(parent_name)
+                    search_path = list(getattr(parent, "__path__", []))
+                else:
+                    # This might not be 100% accurate with what the real
+                    # import system would do, but is good enough for most
+                    # cases.
+                    search_path = sys.path
+                paths: List[Path] = []
+                for p in search_path:
+                    paths.append(Path(p) / f"{module_base}.py")
+                    paths.append(Path(p) / module_base / "__init__.py")
+                print(
+                    f"unable to find import: {fullname} ; "
+                    f"will search {paths}"
+                )
+                result[fullname] = paths
+
+            cur_ex = cur_ex.__cause__ or cur_ex.__context__
+        return result
+
+    def _guess_module_name(self, path: Path) -> Optional[str]:
+        """Guess the name of the module at the specified path, based on the
+        currently loaded packages.
+        """
+        if path.name == "__init__.py":
+            parent_dir = str(path.parent.parent)
+            base_name = path.parent.name
+        else:
+            parent_dir = str(path.parent)
+            base_name = path.stem
+
+        for mod_name, module in list(sys.modules.items()):
+            pkg_path = getattr(module, "__path__", None)
+            if pkg_path is not None and parent_dir in list(pkg_path):
+                return f"{mod_name}.{base_name}"
+        if parent_dir in sys.path:
+            return base_name
+        return None
 
     def _get_monitor_paths(
         self, mod_name: str, mod_paths: List[Path]
     ) -> List[Path]:
-        for pkg in self._monitored_packages:
-            if mod_name == pkg or mod_name.startswith(pkg + "."):
-                return mod_paths
+        if mod_name in self._package_names or mod_name.startswith(
+            self._package_prefixes
+        ):
+            return mod_paths
 
         return []
 
     def cancel(self, context: bpy.types.Context) -> None:
+        worker = self._worker
+        if worker is not None:
+            # The worker cannot be interrupted.  Wait for the run to finish,
+            # so that the monitored code is not still running once the
+            # operator has been torn down, and discard its result.
+            print(
+                f"waiting for the current run of {self._name} to finish",
+                file=sys.stderr,
+            )
+            worker.join()
+            self._worker = None
+            self._results = None
+
         wm = context.window_manager
         timer = self._timer
         assert timer is not None
         wm.event_timer_remove(timer)
+        self._timer = None
+
+        notifier = self._notifier
+        if notifier is not None:
+            notifier.close()
+            self._notifier = None
 
     def check_for_updates(self) -> None:
-        current = self._get_timestamps()
-        if current == self._timestamps:
+        now = time.monotonic()
+        changed = False
+        notifier = self._notifier
+        if notifier is not None and notifier.read_events():
+            changed = True
+
+        if self._timestamps_changed():
+            current = self._get_timestamps()
+            for path, old, new in zip(
+                self._poll_paths, self._timestamps, current
+            ):
+                if old != new:
+                    print(f"detected change to {path}", file=sys.stderr)
+            self._timestamps = current
+            changed = True
+
+        if changed:
+            self._last_change = now
+            if self._pending_since is None:
+                self._pending_since = now
+
+        pending_since = self._pending_since
+        if pending_since is None:
+            return
+        if (
+            now - self._last_change < self.debounce_interval
+            and now - pending_since < self.max_debounce
+        ):
+            return
+        if self._worker is not None:
+            # Wait for the current run to finish before starting another.
             return
 
-        self._timestamps = current
+        self._pending_since = None
         self.on_change()
 
     def _purge_loaded_modules(self) -> None:
@@ -244,30 +666,68 @@ class MonitorOperatorBase(bpy.types.Operator):
         # re-importing modules in the correct order to ensure that some
         # dependent modules always get reloaded before other modules that
         # depend on them.
-        importlib.invalidate_caches()
+        if self._had_missing_files:
+            importlib.invalidate_caches()
+        pop = sys.modules.pop
         for mod_name in self._monitored_modules:
-            sys.modules.pop(mod_name, None)
-
-    def _get_timestamps(self) -> Dict[Path, Optional[float]]:
-        result: Dict[Path, Optional[float]] = {}
-        for path_list in self._monitored_modules.values():
-            for path in path_list:
-                result[path] = self._get_timestamp(path)
-        return result
-
-    def _get_timestamp(self, path: Path) -> Optional[float]:
-        try:
-            s = path.stat()
-        except IOError:
-            return None
-        return s.st_mtime
+            pop(mod_name, None)
+
+    def _timestamps_changed(self) -> bool:
+        if _USE_SCANDIR:
+            return self._scan_timestamps() != self._timestamps
+
+        # This is called on every timer tick, so compare each timestamp as we
+        # go rather than building a new tuple to compare against.  In the
+        # common case where nothing has changed this does no allocation beyond
+        # the stat results.
+        stat = os.stat
+        for path, old in zip(self._poll_paths, self._timestamps):
+            try:
+                mtime: Optional[float] = stat(path).st_mtime
+            except OSError:
+                mtime = None
+            if mtime != old:
+                return True
+        return False
+
+    def _get_timestamps(self) -> Tuple[Optional[float], ...]:
+        if _USE_SCANDIR:
+            return self._scan_timestamps()
+
+        stat = os.stat
+        result: List[Optional[float]] = []
+        for path in self._poll_paths:
+            try:
+                result.append(stat(path).st_mtime)
+            except OSError:
+                result.append(None)
+        return tuple(result)
+
+    def _scan_timestamps(self) -> Tuple[Optional[float], ...]:
+        """Get the timestamps of the polled paths by listing the directories
+        that contain them, rather than calling stat() on each file.
+        """
+        result: List[Optional[float]] = [None] * len(self._poll_paths)
+        for dir_path, name_indices in self._poll_dirs:
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        idx = name_indices.get(entry.name)
+                        if idx is None:
+                            continue
+                        try:
+                            result[idx] = entry.stat().st_mtime
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        return tuple(result)
 
     def on_change(self) -> None:
         if self.delete_all:
-            if bpy.context.object is not None:
-                bpy.ops.object.mode_set(mode="OBJECT")
-            bpy.ops.object.select_all(action="SELECT")
-            bpy.ops.object.delete(use_global=False)
+            # This only removes the current scene's objects and the data they
+            # were the last users of, leaving the rest of the file alone.
+            blender_util.delete_all()
 
         print("=" * 60, file=sys.stderr)
         print(f"Running {self._name}...", file=sys.stderr)
@@ -275,20 +735,31 @@ class MonitorOperatorBase(bpy.types.Operator):
 
         # Unload all currently loaded modules.
         # This ensures that any necessary modules will be re-imported when we
-        # run the functions, so they can be discovered by our ImportTracker.
+        # run the functions, so they can be discovered when we scan
+        # sys.modules afterwards.
         # This is also required for correctness: even modules that have not
         # changed need to be re-imported, since their existing incarnations may
         # use and refer to other modules that were changed.  They need to be
         # reloaded to see up-to-date versions of modules that were changed.
         self._purge_loaded_modules()
 
-        error = False
-        import_tracker = ImportTracker()
-        import_tracker.install()
+        if self.run_in_background:
+            results: queue.Queue[
+                Tuple[float, Optional[Exception], str]
+            ] = queue.Queue()
+            self._results = results
+            worker = threading.Thread(
+                target=self._run_in_background, args=(results,), daemon=True
+            )
+            self._worker = worker
+            worker.start()
+            return
+
+        failed_modules: Optional[Dict[str, List[Path]]] = None
         try:
-            start = time.time()
+            start = time.perf_counter()
             self._run()
-            end = time.time()
+            end = time.perf_counter()
             duration = end - start
             print(f"Finished {self._name} in {duration:.02f}s")
         except Exception as ex:
@@ -299,11 +770,41 @@ class MonitorOperatorBase(bpy.types.Operator):
             # will reload again once the editor has finished writing out the
             # full new file.
             self._report_error(f"error running {self._name}")
-            error = True
-        finally:
-            import_tracker.uninstall()
+            failed_modules = self._get_failed_module_paths(ex)
+
+        self._refresh_monitored_modules(failed_modules)
+
+    def _run_in_background(
+        self, results: queue.Queue[Tuple[float, Optional[Exception], str]]
+    ) -> None:
+        # Only run the monitored code here.  Everything that touches Blender
+        # state happens on the main thread, in _check_worker().  Do not add
+        # any bpy calls to this function.
+        try:
+            start = time.perf_counter()
+            self._run()
+            results.put((time.perf_counter() - start, None, ""))
+        except Exception as ex:
+            results.put((0.0, ex, traceback.format_exc()))
+
+    def _check_worker(self) -> None:
+        results = self._results
+        assert results is not None
+        try:
+            duration, ex, err_str = results.get_nowait()
+        except queue.Empty:
+            return
+
+        self._worker = None
+        self._results = None
+        failed_modules: Optional[Dict[str, List[Path]]] = None
+        if ex is None:
+            print(f"Finished {self._name} in {duration:.02f}s")
+        else:
+            self._report_error(f"error running {self._name}", err_str)
+            failed_modules = self._get_failed_module_paths(ex)
 
-        self._refresh_monitored_modules(import_tracker)
+        self._refresh_monitored_modules(failed_modules)
 
     def _init(self) -> None:
         pass
@@ -311,8 +812,9 @@ class MonitorOperatorBase(bpy.types.Operator):
     def _run(self) -> None:
         raise NotImplementedError("must be implemented by a subclass")
 
-    def _report_error(self, msg: str) -> None:
-        err_str = traceback.format_exc()
+    def _report_error(self, msg: str, err_str: Optional[str] = None) -> None:
+        if err_str is None:
+            err_str = traceback.format_exc()
         # I haven't quite tracked down why, but Blender doesn't always write
         # self.report() messages to the console after operator runs.  Sometimes
         # it does, sometimes it doesn't.  Therefore we also include our own
@@ -345,32 +847,66 @@ class ScriptMonitorOperator(MonitorOperatorBase):
     bl_label = "Monitor External Script"
 
     _local_dir: Path = Path()
+    _local_prefix: str = ""
+    _sys_prefixes: Tuple[str, ...] = ()
     _abs_path: Path = Path()
     # pyre-fixme[31]: bpy property types aren't really types
     path: bpy.props.StringProperty(name="path", default="main.py")
 
+    # The compiled script, and the (modification time in nanoseconds, size)
+    # of the source it was compiled from.  Runs triggered by changes to other
+    # modules can reuse this rather than re-compiling the script.  The size is
+    # included since a rewrite can land within the filesystem's timestamp
+    # resolution and leave the modification time unchanged.
+    _code: Optional[CodeType] = None
+    _code_key: Optional[Tuple[int, int]] = None
+
     def _init(self) -> None:
         self._local_dir = Path(bpy.data.filepath).parent.resolve()
+        self._local_prefix = str(self._local_dir) + os.sep
+        self._sys_prefixes = tuple(
+            {
+                prefix + os.sep
+                for prefix in (sys.prefix, sys.base_prefix, sys.exec_prefix)
+            }
+        )
         self._abs_path = self._local_dir / self.path
         self._name = str(self._abs_path)
 
     def _get_monitor_paths(
         self, mod_name: str, mod_paths: List[Path]
     ) -> List[Path]:
-        if self.monitored_packages is not None:
+        if self.monitored_packages:
             # If an explicit set of packages to monitor was specified,
             # just use that.
             return super()._get_monitor_paths(mod_name, mod_paths)
 
-        return [path for path in mod_paths if self._local_dir in path.parents]
+        # Otherwise monitor all modules under the script's directory.
+        # Skip anything from the Python installation (e.g., a virtualenv
+        # inside the script directory), which can't be part of the project.
+        result: List[Path] = []
+        for path in mod_paths:
+            path_str = str(path)
+            if path_str.startswith(self._sys_prefixes):
+                continue
+            if path_str.startswith(self._local_prefix):
+                result.append(path)
+        return result
 
     def _run(self) -> None:
         global_namespace = {
             "__file__": str(self._abs_path),
             "__name__": "__main__",
         }
-        src_code = self._abs_path.read_text()
-        exec(compile(src_code, str(self._abs_path), "exec"), global_namespace)
+        st = os.stat(self._abs_path)
+        src_key = (st.st_mtime_ns, st.st_size)
+        code = self._code
+        if code is None or src_key != self._code_key:
+            src_code = self._abs_path.read_bytes()
+            code = compile(src_code, str(self._abs_path), "exec")
+            self._code = code
+            self._code_key = src_key
+        exec(code, global_namespace)
 
 
 class FunctionMonitorOperator(MonitorOperatorBase):
@@ -439,7 +975,11 @@ def unregister() -> None:
     bpy.types.TOPBAR_MT_edit.remove(menu_func)
 
 
-def main(fn_name: str, monitored_packages: Optional[List[str]] = None) -> None:
+def main(
+    fn_name: str,
+    monitored_packages: Optional[List[str]] = None,
+    run_in_background: bool = False,
+) -> None:
     try:
         monitored_packages = monitored_packages or []
         monitored_packages_str = ",".join(monitored_packages)
@@ -447,7 +987,9 @@ def main(fn_name: str, monitored_packages: Optional[List[str]] = None) -> None:
         register()
         # pyre-fixme[16]: external_function_monitor is dynamically registered
         bpy.ops.script.external_function_monitor(
-            function=fn_name, monitored_packages=monitored_packages_str
+            function=fn_name,
+            monitored_packages=monitored_packages_str,
+            run_in_background=run_in_background,
         )
     except Exception as ex:
         import logging
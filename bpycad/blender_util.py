@@ -5,10 +5,22 @@
 
 from __future__ import annotations
 
+import array
+import contextlib
+import itertools
 import math
-import random
 import sys
-from typing import cast, Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    cast,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 from types import TracebackType
 
 import bpy
@@ -18,15 +30,77 @@ import mathutils
 from . import cad
 
 
-def delete_all() -> None:
-    if bpy.context.object is not None:
+# Used to generate unique names for boolean modifiers
+_bool_op_counter: Iterator[int] = itertools.count()
+
+
+def ensure_object_mode() -> None:
+    """Switch to object mode, if not already in it."""
+    if bpy.context.mode != "OBJECT" and bpy.context.object is not None:
         bpy.ops.object.mode_set(mode="OBJECT")
-    bpy.ops.object.select_all(action="SELECT")
-    bpy.ops.object.delete(use_global=False)
+
+
+def deselect_all() -> None:
+    """Deselect all objects.
+
+    This is cheaper than bpy.ops.object.select_all(), which goes through
+    the operator machinery and pushes an undo step.
+    """
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+
+
+def select_only(obj: bpy.types.Object) -> None:
+    """Make obj the only selected object, and the active object."""
+    deselect_all()
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+
+
+@contextlib.contextmanager
+def undo_disabled() -> Iterator[None]:
+    """A context manager that disables undo while it is active.
+
+    Scripts that generate a model from scratch have no need to undo the
+    individual steps, and disabling undo avoids the cost of recording the
+    undo steps pushed by each operator.
+    """
+    edit_prefs = bpy.context.preferences.edit
+    old_value = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        yield
+    finally:
+        edit_prefs.use_global_undo = old_value
+
+
+def delete_all() -> None:
+    """Delete all objects in the current scene.
+
+    This removes the objects directly through bpy.data rather than using
+    bpy.ops.object.delete(), which gets slower with the number of objects in
+    the scene and pushes an undo step.  Object data that was only used by
+    the deleted objects is removed as well.
+    """
+    ensure_object_mode()
+    objects = list(bpy.context.scene.objects)
+    if not objects:
+        return
+
+    data_blocks = {obj.data for obj in objects if obj.data is not None}
+    data = bpy.data
+    data.batch_remove(ids=objects)
+    unused = [d for d in data_blocks if d.users == 0]
+    if unused:
+        data.batch_remove(ids=unused)
 
 
 def set_view_distance(distance: float) -> None:
     """Update the camera distance in all viewport panels"""
+    if bpy.app.background:
+        # There are no viewports to update when running without a UI
+        return
+
     layout = bpy.data.screens["Layout"]
     view_areas = [a for a in layout.areas if a.type == "VIEW_3D"]
     for a in view_areas:
@@ -34,37 +108,126 @@ def set_view_distance(distance: float) -> None:
         region.view_distance = distance
 
 
-def blender_mesh(name: str, mesh: cad.Mesh) -> bpy.types.Mesh:
-    points = [(p.x, p.y, p.z) for p in mesh.points]
-    faces = [tuple(reversed(f)) for f in mesh.faces]
+def blender_mesh(
+    name: str, mesh: cad.Mesh, merge_dist: Optional[float] = None
+) -> bpy.types.Mesh:
+    """Create a blender Mesh from a cad.Mesh.
+
+    If merge_dist is specified, points that round to the same position on a
+    grid with this spacing are merged into a single vertex before creating
+    the mesh.  Note that vertex indices in the resulting mesh will then no
+    longer match the MeshPoint indices, so this cannot be combined with
+    Beveler.
+    """
+    # Fill in the mesh data with foreach_set() from flat arrays rather than
+    # using from_pydata().  from_pydata() walks nested Python sequences one
+    # element at a time, while foreach_set() can copy directly from a
+    # buffer, which is much faster for large meshes.
+    if merge_dist is None:
+        coords = array.array("f", mesh.flat_coords())
+        faces = mesh.faces
+    else:
+        points, faces = _merge_points(mesh, merge_dist)
+        coords = array.array("f", [c for p in points for c in p])
+    loop_totals = array.array("i", [len(f) for f in faces])
+    loop_starts = array.array(
+        "i", itertools.accumulate(loop_totals, initial=0)
+    )
+    loop_starts.pop()
+    # Our faces use the opposite winding order from blender.
+    loop_verts = array.array("i", [idx for f in faces for idx in f[::-1]])
 
     blender_mesh: bpy.types.Mesh = bpy.data.meshes.new(name)
-    blender_mesh.from_pydata(points, edges=[], faces=faces)
-    blender_mesh.update()
+    blender_mesh.vertices.add(len(coords) // 3)
+    blender_mesh.vertices.foreach_set("co", coords)
+    blender_mesh.loops.add(len(loop_verts))
+    blender_mesh.loops.foreach_set("vertex_index", loop_verts)
+    blender_mesh.polygons.add(len(faces))
+    blender_mesh.polygons.foreach_set("loop_start", loop_starts)
+    # loop_total is derived from loop_start in Blender 4.0+, and is
+    # read-only there, but older versions need it to be set explicitly.
+    if bpy.app.version < (4, 0, 0):
+        blender_mesh.polygons.foreach_set("loop_total", loop_totals)
+    blender_mesh.update(calc_edges=True)
     return blender_mesh
 
 
+def _merge_points(
+    mesh: cad.Mesh, merge_dist: float
+) -> Tuple[List[Tuple[float, float, float]], List[Sequence[int]]]:
+    """Merge coincident points in a cad.Mesh.
+
+    Returns the list of unique points, and the faces remapped to refer to
+    them.  Faces that collapse to fewer than 3 vertices are dropped.
+    """
+    inv_dist = 1.0 / merge_dist
+    points: List[Tuple[float, float, float]] = []
+    index_by_key: Dict[Tuple[int, int, int], int] = {}
+    remap: List[int] = []
+    for mp in mesh.points:
+        p = mp.point
+        key = (
+            round(p.x * inv_dist),
+            round(p.y * inv_dist),
+            round(p.z * inv_dist),
+        )
+        new_index = index_by_key.get(key)
+        if new_index is None:
+            new_index = len(points)
+            index_by_key[key] = new_index
+            points.append((p.x, p.y, p.z))
+        remap.append(new_index)
+
+    if len(points) == len(remap):
+        return points, mesh.faces
+
+    faces: List[Sequence[int]] = []
+    for f in mesh.faces:
+        new_face: List[int] = []
+        for idx in f:
+            new_idx = remap[idx]
+            if not new_face or new_face[-1] != new_idx:
+                new_face.append(new_idx)
+        if len(new_face) > 1 and new_face[0] == new_face[-1]:
+            new_face.pop()
+        if len(new_face) >= 3:
+            faces.append(new_face)
+    return points, faces
+
+
 def new_mesh_obj(
-    name: str, mesh: Union[cad.Mesh, bpy.types.Mesh]
+    name: str,
+    mesh: Union[cad.Mesh, bpy.types.Mesh],
+    merge_dist: Optional[float] = None,
+    select: bool = True,
 ) -> bpy.types.Object:
+    """Create a new object from a mesh.
+
+    merge_dist is passed to blender_mesh() when mesh is a cad.Mesh.
+    If select is True the new object is selected and made the active object.
+    Callers creating many objects that will immediately be passed to
+    functions that do not need the selection can pass select=False to skip
+    this.
+    """
     if isinstance(mesh, cad.Mesh):
-        mesh = blender_mesh(f"{name}_mesh", mesh)
+        mesh = blender_mesh(f"{name}_mesh", mesh, merge_dist=merge_dist)
 
-    obj: bpy.types.Object = bpy.data.objects.new(name, mesh)
-    collection = bpy.data.collections[0]
-    collection.objects.link(obj)
+    data = bpy.data
+    obj: bpy.types.Object = data.objects.new(name, mesh)
+    # Note that we intentionally look up the collection each time rather than
+    # caching it: ID references become invalid if a new file is loaded.
+    data.collections[0].objects.link(obj)
 
-    # Select the newly created object
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
+    if select:
+        # Select the newly created object
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
 
     return obj
 
 
 def dissolve_limited(obj: bpy.types.Object, angle: float) -> None:
-    bpy.ops.object.select_all(action="DESELECT")
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
+    select_only(obj)
     bpy.ops.object.mode_set(mode="EDIT")
     bpy.ops.mesh.select_all(action="SELECT")
 
@@ -92,12 +255,9 @@ def boolean_op(
     applied after the operator, with the specified angle limit.  dissolve_angle
     should be specified in degrees (rather than radians).
     """
-    bpy.ops.object.select_all(action="DESELECT")
-    obj1.select_set(True)
-    bpy.context.view_layer.objects.active = obj1
+    select_only(obj1)
 
-    randn = random.randint(0, 1000000)
-    mod_name = f"bool_op_{randn}"
+    mod_name = f"bool_op_{next(_bool_op_counter)}"
     mod = cast(
         bpy.types.BooleanModifier,
         obj1.modifiers.new(name=mod_name, type="BOOLEAN"),
@@ -107,92 +267,337 @@ def boolean_op(
     mod.double_threshold = 1e-12
 
     if apply_mod:
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        _apply_modifier(obj1, mod)
+        bpy.data.objects.remove(obj2, do_unlink=True)
 
-        bpy.ops.object.select_all(action="DESELECT")
-        obj2.select_set(True)
-        bpy.ops.object.delete(use_global=False)
+        _remove_doubles(obj1, dissolve_angle)
 
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode="EDIT")
 
-        # Merge vertices that are close together
-        # Do this after every boolean operator, otherwise blender ends up
-        # leaving slightly bad geometry in some cases where the intersections
-        # are close to existing vertices.
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.remove_doubles()
+def boolean_op_many(
+    obj1: bpy.types.Object,
+    operands: Sequence[bpy.types.Object],
+    op: str,
+    apply_mod: bool = True,
+    dissolve_angle: Optional[float] = None,
+) -> None:
+    """
+    Modifies obj1 by performing a boolean operation with all of the operand
+    objects at once.
+
+    This is much faster than calling boolean_op() once per operand, since
+    Blender only has to evaluate and apply a single modifier, and the
+    vertex cleanup afterwards is only done once.
+
+    If apply_mod is True, the modifier is applied and the operand objects are
+    deleted before returning.  If apply_mod is False, the operand objects
+    remain linked to a new collection used as the modifier's operand.
+    """
+    select_only(obj1)
+
+    mod_name = f"bool_op_{next(_bool_op_counter)}"
+    operand_collection = bpy.data.collections.new(f"{mod_name}_operands")
+    for operand in operands:
+        operand_collection.objects.link(operand)
+
+    mod = cast(
+        bpy.types.BooleanModifier,
+        obj1.modifiers.new(name=mod_name, type="BOOLEAN"),
+    )
+    mod.operand_type = "COLLECTION"
+    mod.collection = operand_collection
+    mod.operation = op
+    mod.double_threshold = 1e-12
+
+    if apply_mod:
+        _apply_modifier(obj1, mod)
+
+        ids: List[bpy.types.ID] = [*operands, operand_collection]
+        bpy.data.batch_remove(ids=ids)
+
+        _remove_doubles(obj1, dissolve_angle)
+
+
+def _apply_modifier(obj: bpy.types.Object, mod: bpy.types.Modifier) -> None:
+    """Apply a modifier to an object's mesh.
+
+    The object must be the active object.
+    """
+    ensure_unique_data(obj)
+    mesh = obj.data
+    assert isinstance(mesh, bpy.types.Mesh)
+    if (
+        len(obj.modifiers) != 1
+        or mesh.users != 1
+        or mesh.shape_keys is not None
+    ):
+        # modifier_apply() refuses to apply modifiers to meshes with shape
+        # keys, rather than silently baking them, so use it in that case too.
+        bpy.ops.object.modifier_apply(modifier=mod.name)
+        return
+
+    # When this is the object's only modifier, the evaluated mesh is exactly
+    # the result of applying it.  Copy that out of the depsgraph directly,
+    # rather than going through the modifier_apply operator.  Preserve all
+    # data layers, since by default only the ones needed for display are
+    # kept.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    new_mesh = bpy.data.meshes.new_from_object(
+        obj.evaluated_get(depsgraph),
+        preserve_all_data_layers=True,
+        depsgraph=depsgraph,
+    )
+    obj.modifiers.remove(mod)
+    obj.data = new_mesh
+    mesh_name = mesh.name
+    bpy.data.meshes.remove(mesh)
+    new_mesh.name = mesh_name
+
+
+def _remove_doubles(
+    obj: bpy.types.Object, dissolve_angle: Optional[float] = None
+) -> None:
+    # Merge vertices that are close together
+    # Do this after every boolean and bevel operator, otherwise blender ends up
+    # leaving slightly bad geometry in some cases where the intersections
+    # are close to existing vertices.
+    #
+    # This operates on the mesh data directly with bmesh rather than using
+    # the bpy.ops.mesh operators, which would require switching the object
+    # into edit mode and back.  The distance and delimit settings match the
+    # defaults of the corresponding operators.
+    mesh = obj.data
+    assert isinstance(mesh, bpy.types.Mesh)
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
         if dissolve_angle is not None:
-            rad = math.radians(dissolve_angle)
-            bpy.ops.mesh.dissolve_limited(angle_limit=rad)
-        bpy.ops.mesh.select_all(action="DESELECT")
+            bmesh.ops.dissolve_limit(
+                bm,
+                angle_limit=math.radians(dissolve_angle),
+                verts=bm.verts,
+                edges=bm.edges,
+                delimit={"NORMAL"},
+            )
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
 
-        bpy.ops.object.mode_set(mode="OBJECT")
+
+def _boolean_op_any(
+    obj1: bpy.types.Object,
+    obj2: Union[bpy.types.Object, Sequence[bpy.types.Object]],
+    op: str,
+    apply_mod: bool,
+    dissolve_angle: Optional[float],
+) -> None:
+    if isinstance(obj2, bpy.types.Object):
+        boolean_op(
+            obj1, obj2, op, apply_mod=apply_mod, dissolve_angle=dissolve_angle
+        )
+    else:
+        boolean_op_many(
+            obj1, obj2, op, apply_mod=apply_mod, dissolve_angle=dissolve_angle
+        )
 
 
 def difference(
     obj1: bpy.types.Object,
-    obj2: bpy.types.Object,
+    obj2: Union[bpy.types.Object, Sequence[bpy.types.Object]],
     apply_mod: bool = True,
     dissolve_angle: Optional[float] = None,
 ) -> None:
-    boolean_op(
-        obj1,
-        obj2,
-        "DIFFERENCE",
-        apply_mod=apply_mod,
-        dissolve_angle=dissolve_angle,
-    )
+    _boolean_op_any(obj1, obj2, "DIFFERENCE", apply_mod, dissolve_angle)
 
 
 def union(
     obj1: bpy.types.Object,
-    obj2: bpy.types.Object,
+    obj2: Union[bpy.types.Object, Sequence[bpy.types.Object]],
     apply_mod: bool = True,
     dissolve_angle: Optional[float] = None,
 ) -> None:
-    boolean_op(
-        obj1, obj2, "UNION", apply_mod=apply_mod, dissolve_angle=dissolve_angle
-    )
+    _boolean_op_any(obj1, obj2, "UNION", apply_mod, dissolve_angle)
 
 
 def intersect(
     obj1: bpy.types.Object,
-    obj2: bpy.types.Object,
+    obj2: Union[bpy.types.Object, Sequence[bpy.types.Object]],
     apply_mod: bool = True,
     dissolve_angle: Optional[float] = None,
 ) -> None:
-    boolean_op(
-        obj1,
-        obj2,
-        "INTERSECT",
-        apply_mod=apply_mod,
-        dissolve_angle=dissolve_angle,
-    )
+    _boolean_op_any(obj1, obj2, "INTERSECT", apply_mod, dissolve_angle)
 
 
-def apply_to_wall_transform(
-    left: cad.Point, right: cad.Point, x: float = 0.0, z: float = 0.0
-) -> cad.Transform:
-    wall_len = math.sqrt(((right.y - left.y) ** 2) + ((right.x - left.x) ** 2))
-    angle = math.atan2(right.y - left.y, right.x - left.x)
+def union_many(
+    objs: Sequence[bpy.types.Object], dissolve_angle: Optional[float] = None
+) -> bpy.types.Object:
+    """
+    Union all of the specified objects together.
 
-    tf = cad.Transform()
+    The result is stored in the first object, which is returned, and all
+    other objects are deleted.
+
+    Rather than unioning each object into the result one at a time, this
+    groups the objects into clusters whose bounding boxes overlap.  Each
+    cluster is unioned with a single boolean operation, and the clusters are
+    then joined together without any boolean computation, since they do not
+    share any geometry.
+    """
+    assert objs, "union_many() requires at least one object"
+    bounds = [_world_bounds(obj) for obj in objs]
+
+    # Group overlapping objects with a union-find over a sweep along the
+    # x axis.
+    parents = list(range(len(objs)))
+
+    def find(idx: int) -> int:
+        while parents[idx] != idx:
+            parents[idx] = parents[parents[idx]]
+            idx = parents[idx]
+        return idx
+
+    active: List[int] = []
+    for idx in sorted(range(len(objs)), key=lambda i: bounds[i][0][0]):
+        mins, maxs = bounds[idx]
+        active = [other for other in active if bounds[other][1][0] >= mins[0]]
+        for other in active:
+            other_mins, other_maxs = bounds[other]
+            if (
+                other_mins[1] <= maxs[1]
+                and mins[1] <= other_maxs[1]
+                and other_mins[2] <= maxs[2]
+                and mins[2] <= other_maxs[2]
+            ):
+                parents[find(other)] = find(idx)
+        active.append(idx)
+
+    clusters: Dict[int, List[bpy.types.Object]] = {}
+    for idx, obj in enumerate(objs):
+        clusters.setdefault(find(idx), []).append(obj)
+
+    cluster_objs: List[bpy.types.Object] = []
+    for members in clusters.values():
+        if len(members) > 1:
+            boolean_op_many(
+                members[0],
+                members[1:],
+                "UNION",
+                dissolve_angle=dissolve_angle,
+            )
+        cluster_objs.append(members[0])
+
+    # The first object always comes first in its own cluster, and the
+    # clusters are in order of their first member.
+    result = cluster_objs[0]
+    assert result is objs[0]
+    if len(cluster_objs) > 1:
+        join(result, cluster_objs[1:])
+    return result
 
-    # Move the object along the x axis so it ends up centered on the wall.
-    # This assumes the object starts centered around the origin.
-    #
-    # Also apply any extra X and Z translation supplied by the caller.
-    tf = tf.translate(x + wall_len * 0.5, 0.0, z)
 
-    # Next rotate the object so it is at the same angle to the x axis
-    # as the wall.
-    tf = tf.rotate_radians(0.0, 0.0, angle)
+def join(obj: bpy.types.Object, others: Sequence[bpy.types.Object]) -> None:
+    """
+    Merge the mesh data from the other objects into obj, and delete the
+    other objects.
 
-    # Finally move the object from the origin so it is at the wall location
-    tf = tf.translate(left.x, left.y, 0.0)
+    Unlike union(), this does not perform any boolean computation, so it is
+    much cheaper, but should only be used if the objects do not overlap.
+    """
+    ensure_unique_data(obj)
+    mesh = obj.data
+    assert isinstance(mesh, bpy.types.Mesh)
+    to_local = obj.matrix_world.inverted()
+    identity = mathutils.Matrix.Identity(4)
+
+    bm = _acquire_bmesh()
+    try:
+        bm.from_mesh(mesh)
+        for other in others:
+            other_mesh = other.data
+            assert isinstance(other_mesh, bpy.types.Mesh)
+            matrix = to_local @ other.matrix_world
+            if matrix == identity:
+                bm.from_mesh(other_mesh)
+            else:
+                tmp_mesh = other_mesh.copy()
+                tmp_mesh.transform(matrix)
+                bm.from_mesh(tmp_mesh)
+                bpy.data.meshes.remove(tmp_mesh)
+        bm.to_mesh(mesh)
+    finally:
+        _release_bmesh(bm)
+    mesh.update()
 
-    return tf
+    bpy.data.batch_remove(ids=list(others))
+
+
+def _world_bounds(
+    obj: bpy.types.Object,
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """Return the min and max corners of an object's world-space bounding
+    box.
+    """
+    mesh = obj.data
+    assert isinstance(mesh, bpy.types.Mesh)
+    coords = array.array("f", [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", coords)
+    if not coords:
+        loc = obj.matrix_world.translation
+        return (loc.x, loc.y, loc.z), (loc.x, loc.y, loc.z)
+
+    local_ranges = [(min(coords[i::3]), max(coords[i::3])) for i in range(3)]
+    matrix = obj.matrix_world
+    corners = [
+        matrix @ mathutils.Vector(corner)
+        for corner in itertools.product(*local_ranges)
+    ]
+    return (
+        (
+            min(c.x for c in corners),
+            min(c.y for c in corners),
+            min(c.z for c in corners),
+        ),
+        (
+            max(c.x for c in corners),
+            max(c.y for c in corners),
+            max(c.z for c in corners),
+        ),
+    )
+
+
+def apply_to_wall_transform(
+    left: cad.Point, right: cad.Point, x: float = 0.0, z: float = 0.0
+) -> cad.Transform:
+    dx = right.x - left.x
+    dy = right.y - left.y
+    wall_len = math.hypot(dx, dy)
+    # The cosine and sine of the wall's angle to the x axis
+    if wall_len == 0.0:
+        cos_a, sin_a = 1.0, 0.0
+    else:
+        cos_a = dx / wall_len
+        sin_a = dy / wall_len
+
+    # This builds the combined matrix directly, rather than composing the
+    # individual steps.  The object is:
+    # - moved along the x axis so it ends up centered on the wall, plus any
+    #   extra X and Z translation supplied by the caller.  This assumes the
+    #   object starts centered around the origin.
+    # - rotated around the z axis so it is at the same angle to the x axis
+    #   as the wall.
+    # - moved from the origin so it is at the wall location.
+    x_offset = x + wall_len * 0.5
+    return cad.Transform(
+        mathutils.Matrix(
+            (
+                (cos_a, -sin_a, 0.0, left.x + x_offset * cos_a),
+                (sin_a, cos_a, 0.0, left.y + x_offset * sin_a),
+                (0.0, 0.0, 1.0, z),
+                (0.0, 0.0, 0.0, 1.0),
+            )
+        )
+    )
 
 
 def apply_to_wall(
@@ -210,16 +615,95 @@ def apply_to_wall(
     centered on the wall.
     """
     tf = apply_to_wall_transform(left, right, x, z)
-    with TransformContext(obj) as ctx:
-        ctx.transform(tf)
+    apply_transforms(obj, [tf])
+
+
+def apply_transforms(
+    obj: bpy.types.Object, transforms: Sequence[cad.Transform]
+) -> None:
+    """Apply a sequence of transforms to an object's mesh, in order.
+
+    The transforms are combined into a single matrix, which is applied to
+    the mesh data in one pass.
+    """
+    if not transforms:
+        return
+
+    matrix = mathutils.Matrix(transforms[0]._data)
+    for tf in transforms[1:]:
+        matrix = tf._data @ matrix
+
+    ensure_unique_data(obj)
+    mesh = obj.data
+    assert isinstance(mesh, bpy.types.Mesh)
+    mesh.transform(matrix)
+    mesh.update()
+
+
+# A BMesh that is kept around after use so that the next TransformContext
+# can reuse it rather than allocating a new one.
+_free_bmesh: Optional[bmesh.types.BMesh] = None
+
+
+def _acquire_bmesh() -> bmesh.types.BMesh:
+    global _free_bmesh
+    bm = _free_bmesh
+    if bm is None:
+        return bmesh.new()
+    _free_bmesh = None
+    return bm
+
+
+def _release_bmesh(bm: bmesh.types.BMesh) -> None:
+    global _free_bmesh
+    if _free_bmesh is None:
+        bm.clear()
+        _free_bmesh = bm
+    else:
+        bm.free()
+
+
+def free_cached_bmesh() -> None:
+    """Free the BMesh cached for reuse by TransformContext, if any."""
+    global _free_bmesh
+    bm = _free_bmesh
+    if bm is not None:
+        _free_bmesh = None
+        bm.free()
 
 
 class TransformContext:
+    """
+    A helper for modifying an object's mesh data.
+
+    Affine transformations (rotate, translate, scale and transform) are
+    accumulated into a single matrix.  If those are the only operations
+    performed, the matrix is applied directly to the mesh with
+    Mesh.transform() on exit, without ever converting the mesh to a BMesh.
+    The BMesh is only created if another operation needs it, or if the
+    bmesh attribute is accessed directly.  Once the BMesh exists, affine
+    transformations are applied to it immediately.
+    """
+
     def __init__(self, obj: bpy.types.Object) -> None:
         self.obj = obj
-        self.bmesh: bmesh.types.BMesh = bmesh.new()
-        # pyre-fixme[6]: obj.data must be a Mesh
-        self.bmesh.from_mesh(obj.data)
+        self._bmesh: Optional[bmesh.types.BMesh] = None
+        self._matrix: Optional[mathutils.Matrix] = None
+
+    @property
+    def bmesh(self) -> bmesh.types.BMesh:
+        bm = self._bmesh
+        if bm is None:
+            bm = _acquire_bmesh()
+            # pyre-fixme[6]: obj.data must be a Mesh
+            bm.from_mesh(self.obj.data)
+            self._bmesh = bm
+
+        matrix = self._matrix
+        if matrix is not None:
+            self._matrix = None
+            bmesh.ops.transform(bm, verts=bm.verts, matrix=matrix)
+        return bm
 
     def __enter__(self) -> TransformContext:
         return self
@@ -230,10 +714,31 @@ class TransformContext:
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
+        bm = self._bmesh
         if exc_value is None:
-            # pyre-fixme[6]: obj.data must be a Mesh
-            self.bmesh.to_mesh(self.obj.data)
-        self.bmesh.free()
+            ensure_unique_data(self.obj)
+            mesh = self.obj.data
+            assert isinstance(mesh, bpy.types.Mesh)
+            if bm is not None:
+                self.bmesh.to_mesh(mesh)
+            elif self._matrix is not None:
+                mesh.transform(self._matrix)
+                mesh.update()
+        if bm is not None:
+            self._bmesh = None
+            _release_bmesh(bm)
+
+    def _apply_matrix(self, matrix: mathutils.Matrix) -> None:
+        bm = self._bmesh
+        if bm is not None:
+            # Once the BMesh exists callers may be operating on it directly,
+            # so apply the transform immediately to preserve the order of
+            # operations.
+            bmesh.ops.transform(bm, verts=bm.verts, matrix=matrix)
+        elif self._matrix is None:
+            self._matrix = matrix
+        else:
+            self._matrix = matrix @ self._matrix
 
     def rotate(
         self,
@@ -241,31 +746,58 @@ class TransformContext:
         axis: str,
         center: Optional[Tuple[float, float, float]] = None,
     ) -> None:
-        if center is None:
-            center = (0.0, 0.0, 0.0)
+        rad = math.radians(angle)
+        c = math.cos(rad)
+        s = math.sin(rad)
+        if axis == "X":
+            rows = ((1.0, 0.0, 0.0), (0.0, c, -s), (0.0, s, c))
+        elif axis == "Y":
+            rows = ((c, 0.0, s), (0.0, 1.0, 0.0), (-s, 0.0, c))
+        elif axis == "Z":
+            rows = ((c, -s, 0.0), (s, c, 0.0), (0.0, 0.0, 1.0))
+        else:
+            raise ValueError(f"invalid rotation axis: {axis!r}")
 
-        bmesh.ops.rotate(
-            self.bmesh,
-            verts=self.bmesh.verts,
-            cent=center,
-            matrix=mathutils.Matrix.Rotation(math.radians(angle), 3, axis),
+        # Rotating around a center point is equivalent to rotating around the
+        # origin and then translating by (center - rotated center).
+        if center is None:
+            offset = (0.0, 0.0, 0.0)
+        else:
+            offset = tuple(
+                center[i]
+                - (
+                    rows[i][0] * center[0]
+                    + rows[i][1] * center[1]
+                    + rows[i][2] * center[2]
+                )
+                for i in range(3)
+            )
+        self._apply_matrix(
+            mathutils.Matrix(
+                (
+                    (*rows[0], offset[0]),
+                    (*rows[1], offset[1]),
+                    (*rows[2], offset[2]),
+                    (0.0, 0.0, 0.0, 1.0),
+                )
+            )
         )
 
     def translate(self, x: float, y: float, z: float) -> None:
-        bmesh.ops.translate(self.bmesh, verts=self.bmesh.verts, vec=(x, y, z))
+        self._apply_matrix(mathutils.Matrix.Translation((x, y, z)))
 
     def scale(self, x: float, y: float, z: float) -> None:
-        bmesh.ops.scale(self.bmesh, verts=self.bmesh.verts, vec=(x, y, z))
+        self._apply_matrix(mathutils.Matrix.Diagonal((x, y, z, 1.0)))
 
     def transform(self, tf: cad.Transform) -> None:
-        matrix = mathutils.Matrix(tf._data)
-        bmesh.ops.transform(self.bmesh, verts=self.bmesh.verts, matrix=matrix)
+        self._apply_matrix(mathutils.Matrix(tf._data))
 
     def triangulate(self) -> None:
-        bmesh.ops.triangulate(self.bmesh, faces=self.bmesh.faces[:])
+        bmesh.ops.triangulate(self.bmesh, faces=self.bmesh.faces)
 
     def mirror_x(self) -> None:
-        geom = self.bmesh.faces[:] + self.bmesh.verts[:] + self.bmesh.edges[:]
+        bm = self.bmesh
+        geom = list(itertools.chain(bm.faces, bm.verts, bm.edges))
         # Mirror creates new mirrored geometry
         # Set merge_dist to a negative value to prevent any of the new mirrored
         # geometry from being merged with the original vertices.
@@ -275,10 +807,14 @@ class TransformContext:
         # Delete the original geometry
         bmesh.ops.delete(self.bmesh, geom=geom)
         # Reverse the faces to restore the correct normal direction
-        bmesh.ops.reverse_faces(self.bmesh, faces=self.bmesh.faces[:])
+        bmesh.ops.reverse_faces(self.bmesh, faces=self.bmesh.faces)
 
 
 def set_shading_mode(mode: str) -> None:
+    if bpy.app.background:
+        # There are no viewports to update when running without a UI
+        return
+
     for area in bpy.context.workspace.screens[0].areas:
         for space in area.spaces:
             if space.type == "VIEW_3D":
@@ -414,9 +950,7 @@ def text_curve_to_mesh_object(
     collection.objects.link(mesh_obj)
     bpy.data.objects.remove(curve_obj, do_unlink=True)
 
-    bpy.ops.object.select_all(action="DESELECT")
-    mesh_obj.select_set(True)
-    bpy.context.view_layer.objects.active = mesh_obj
+    select_only(mesh_obj)
 
     # Converting a TextCurve to a mesh unfortunately produces non-manifold
     # geometry.  Run beautify_fill() to attempt to clean up non-manifold faces.
@@ -452,25 +986,42 @@ class Beveler:
         self, p0: cad.MeshPoint, p1: cad.MeshPoint, weight: float = 1.0
     ) -> None:
         """Set the bevel weight for an edge"""
-        if p0.index < p1.index:
-            key = p0.index, p1.index
-        else:
-            key = p1.index, p0.index
-        self._bevel_edges[key] = weight
+        i0 = p0.index
+        i1 = p1.index
+        self._bevel_edges[(i0, i1) if i0 < i1 else (i1, i0)] = weight
 
     def get_bevel_weights(
         self, edges: Sequence[bpy.types.MeshEdge]
     ) -> Dict[int, float]:
         results: Dict[int, float] = {}
-        for idx, e in enumerate(edges):
-            v0 = e.vertices[0]
-            v1 = e.vertices[1]
+        bevel_edges = self._bevel_edges
+        if not bevel_edges:
+            return results
+
+        # Fetch all of the edge vertex indices with a single foreach_get()
+        # call when possible, rather than accessing each edge's vertices
+        # attribute individually.
+        if isinstance(edges, bpy.types.bpy_prop_collection):
+            edge_verts = array.array("i", [0]) * (len(edges) * 2)
+            edges.foreach_get("vertices", edge_verts)
+        else:
+            edge_verts = [v for e in edges for v in e.vertices]
+
+        # Usually only a small fraction of the edges have weights.  Checking
+        # membership of each vertex in a set of integers first is cheaper
+        # than building a tuple key and looking it up for every edge.
+        bevel_verts = {v for key in bevel_edges for v in key}
+
+        verts_iter = iter(edge_verts)
+        for idx, (v0, v1) in enumerate(zip(verts_iter, verts_iter)):
+            if v0 not in bevel_verts or v1 not in bevel_verts:
+                continue
             if v0 < v1:
                 key = v0, v1
             else:
                 key = v1, v0
 
-            weight = self._bevel_edges.get(key, 0.0)
+            weight = bevel_edges.get(key, 0.0)
             if weight > 0.0:
                 results[idx] = weight
 
@@ -479,32 +1030,41 @@ class Beveler:
     def apply_bevels(
         self, obj: bpy.types.Object, width: float = 2.0, segments: int = 8
     ) -> None:
+        ensure_unique_data(obj)
         mesh = obj.data
         assert isinstance(
             mesh, bpy.types.Mesh
         ), "bevels can only be applied to mesh objects"
         edge_weights = self.get_bevel_weights(mesh.edges)
 
+        # Write all of the weights with a single foreach_set() call, rather
+        # than assigning each edge's value individually.  If the attribute
+        # already exists, start from its current values so that we only
+        # change the edges we have weights for.
+        weights = array.array("f", [0.0]) * len(mesh.edges)
         edge_weights_attr = mesh.attributes.get("bevel_weight_edge")
         if edge_weights_attr is None:
             edge_weights_attr = mesh.attributes.new(
                 "bevel_weight_edge", "FLOAT", "EDGE"
             )
+        else:
+            edge_weights_attr.data.foreach_get("value", weights)
 
         for edge_idx, weight in edge_weights.items():
-            edge_weights_attr.data[edge_idx].value = weight
-
-            e = mesh.edges[edge_idx]
-
-            # Blender 4.x+ uses the "bevel_weight_edge" mesh attribute for
-            # edge weights.  Older versions of blender had this as a property
-            # on the MeshEdge object.
-            # (https://projects.blender.org/blender/blender/issues/95966)
-            # If the edge has the old property, we are on an older version of
-            # blender, so set it.
-            if hasattr(e, "bevel_weight"):
-                # pyre-fixme[16]: we have explicitly confirmed the bevel_weight
-                #   attribute exists.
+            weights[edge_idx] = weight
+        edge_weights_attr.data.foreach_set("value", weights)
+
+        # Blender 4.x+ uses the "bevel_weight_edge" mesh attribute for
+        # edge weights.  Older versions of blender had this as a property
+        # on the MeshEdge object.
+        # (https://projects.blender.org/blender/blender/issues/95966)
+        # If the edges have the old property, we are on an older version of
+        # blender, so set it.
+        if len(mesh.edges) > 0 and hasattr(mesh.edges[0], "bevel_weight"):
+            for edge_idx, weight in edge_weights.items():
+                e = mesh.edges[edge_idx]
+                # pyre-fixme[16]: we have explicitly confirmed the
+                #   bevel_weight attribute exists.
                 e.bevel_weight = weight
 
         # Create the bevel modifier
@@ -517,19 +1077,11 @@ class Beveler:
         bevel.segments = segments
 
         # Apply the modifier
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.ops.object.modifier_apply(modifier=bevel.name)
-
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode="EDIT")
+        select_only(obj)
+        _apply_modifier(obj, bevel)
 
         # Merge vertices that are close together
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.remove_doubles()
-        bpy.ops.mesh.select_all(action="DESELECT")
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+        _remove_doubles(obj)
 
 
 def get_script_args() -> List[str]:
@@ -556,3 +1108,54 @@ def duplicate(
     bpy.context.collection.objects.link(new_obj)
 
     return new_obj
+
+
+# A custom property set on data shared by duplicate_batch(), marking that the
+# sharing is only an optimization, and the data should be copied before any
+# of its users modify it.
+_COPY_ON_WRITE_PROP = "bpycad_copy_on_write"
+
+
+def duplicate_batch(
+    obj: bpy.types.Object, names: Sequence[str], linked: bool = True
+) -> List[bpy.types.Object]:
+    """Create several duplicates of an object.
+
+    By default the duplicates share the original object's data, rather than
+    each getting its own copy.  The shared data is marked as copy-on-write:
+    functions in this module that modify an object's mesh call
+    ensure_unique_data() first, so the original and each duplicate only get
+    their own copy of the data once they are actually modified.  This makes
+    it cheap to create many copies of the same shape, e.g. for use as
+    boolean operands.
+
+    This differs from duplicate(linked=True), whose duplicates really do
+    share their data, so that modifying one modifies all of them.
+    """
+    data = obj.data
+    if linked:
+        data[_COPY_ON_WRITE_PROP] = True
+    collection = bpy.context.collection
+    new_objs: List[bpy.types.Object] = []
+    for name in names:
+        new_data = data if linked else data.copy()
+        new_obj = bpy.data.objects.new(name, new_data)
+        collection.objects.link(new_obj)
+        new_objs.append(new_obj)
+    return new_objs
+
+
+def ensure_unique_data(obj: bpy.types.Object) -> None:
+    """Give obj its own copy of its data if it shares copy-on-write data
+    created by duplicate_batch() with other objects.
+
+    Call this before modifying an object's data in place.  Data shared in
+    any other way, such as by duplicate(linked=True), is left shared, so
+    changes still reach all of its users.
+    """
+    data = obj.data
+    if not data.get(_COPY_ON_WRITE_PROP, False):
+        return
+    # A fake user keeps the data alive, but is not another object using it.
+    if data.users - int(data.use_fake_user) > 1:
+        obj.data = data.copy()
@@ -7,20 +7,28 @@ from __future__ import annotations
 
 from enum import IntEnum
 import math
+from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 # Blender modules
 import mathutils
 
+from . import stl
+
 
 class Transform:
     def __init__(self, data: Optional[mathutils.Matrix] = None) -> None:
         if data is None:
-            self._data: mathutils.Matrix = mathutils.Matrix(
-                ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
-            )
+            self._data: mathutils.Matrix = mathutils.Matrix.Identity(4)
         else:
             self._data: mathutils.Matrix = data
+        self._rows: Optional[
+            Tuple[
+                Tuple[float, float, float, float],
+                Tuple[float, float, float, float],
+                Tuple[float, float, float, float],
+            ]
+        ] = None
 
     def __str__(self) -> str:
         row_strs = []
@@ -33,14 +41,44 @@ class Transform:
     def point(self) -> Point:
         return Point(self._data[0][3], self._data[1][3], self._data[2][3])
 
+    def _affine_rows(
+        self,
+    ) -> Tuple[
+        Tuple[float, float, float, float],
+        Tuple[float, float, float, float],
+        Tuple[float, float, float, float],
+    ]:
+        """Return the top 3 rows of the matrix as plain float tuples.
+
+        The bottom row of an affine transform is always (0, 0, 0, 1), so
+        these rows are all that is needed to transform a point.
+        """
+        rows = self._rows
+        if rows is None:
+            data = self._data
+            rows = (tuple(data[0]), tuple(data[1]), tuple(data[2]))
+            self._rows = rows
+        return rows
+
     def apply(self, point: Point) -> Point:
-        x = self._data @ mathutils.Vector((point.x, point.y, point.z, 1.0))
-        return Point(x[0], x[1], x[2])
+        (r0, r1, r2) = self._affine_rows()
+        x = point.x
+        y = point.y
+        z = point.z
+        return Point(
+            r0[0] * x + r0[1] * y + r0[2] * z + r0[3],
+            r1[0] * x + r1[1] * y + r1[2] * z + r1[3],
+            r2[0] * x + r2[1] * y + r2[2] * z + r2[3],
+        )
 
     def transform(self, tf: Transform) -> Transform:
         return Transform(tf._data @ self._data)
 
     def translate(self, x: float, y: float, z: float) -> Transform:
+        if x == 0.0 and y == 0.0 and z == 0.0:
+            # Transform objects are never modified in place,
+            # so it is safe to return self for a no-op.
+            return self
         tl = mathutils.Matrix(
             ((1, 0, 0, x), (0, 1, 0, y), (0, 0, 1, z), (0, 0, 0, 1))
         )
@@ -56,52 +94,49 @@ class Transform:
         return self.rotate_radians(xr, yr, zr)
 
     def rotate_radians(self, x: float, y: float, z: float) -> Transform:
+        if x == 0.0 and y == 0.0 and z == 0.0:
+            return self
+        sx = math.sin(x)
+        cx = math.cos(x)
+        sy = math.sin(y)
+        cy = math.cos(y)
+        sz = math.sin(z)
+        cz = math.cos(z)
         rot = mathutils.Matrix(
             (
                 (
-                    math.cos(y) * math.cos(z),
-                    (math.sin(x) * math.sin(y) * math.cos(z))
-                    - (math.cos(x) * math.sin(z)),
-                    (math.cos(x) * math.sin(y) * math.cos(z))
-                    + (math.sin(x) * math.sin(z)),
+                    cy * cz,
+                    (sx * sy * cz) - (cx * sz),
+                    (cx * sy * cz) + (sx * sz),
                     0,
                 ),
                 (
-                    math.cos(y) * math.sin(z),
-                    (math.sin(x) * math.sin(y) * math.sin(z))
-                    + (math.cos(x) * math.cos(z)),
-                    (math.cos(x) * math.sin(y) * math.sin(z))
-                    - (math.sin(x) * math.cos(z)),
-                    0,
-                ),
-                (
-                    -math.sin(y),
-                    math.sin(x) * math.cos(y),
-                    math.cos(x) * math.cos(y),
+                    cy * sz,
+                    (sx * sy * sz) + (cx * cz),
+                    (cx * sy * sz) - (sx * cz),
                     0,
                 ),
+                (-sy, sx * cy, cx * cy, 0),
                 (0, 0, 0, 1),
             )
         )
         return Transform(rot @ self._data)
 
     def mirror_x(self) -> Transform:
-        mirror = mathutils.Matrix(
-            ((-1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
-        )
-        return Transform(mirror @ self._data)
+        return self._mirror(0)
 
     def mirror_y(self) -> Transform:
-        mirror = mathutils.Matrix(
-            ((0, 0, 0, 0), (0, -1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
-        )
-        return Transform(mirror @ self._data)
+        return self._mirror(1)
 
     def mirror_z(self) -> Transform:
-        mirror = mathutils.Matrix(
-            ((0, 0, 0, 0), (0, 1, 0, 0), (0, 0, -1, 0), (0, 0, 0, 1))
-        )
-        return Transform(mirror @ self._data)
+        return self._mirror(2)
+
+    def _mirror(self, axis: int) -> Transform:
+        # Mirroring across an axis is a diagonal matrix with -1 for that
+        # axis, so multiplying by it just negates the corresponding row.
+        data = self._data.copy()
+        data[axis] = -data[axis]
+        return Transform(data)
 
 
 class Point:
@@ -137,7 +172,7 @@ class Point:
         return Transform().translate(self.x, self.y, self.z)
 
     def transform(self, tf: Transform) -> Point:
-        return self.to_transform().transform(tf).point()
+        return tf.apply(self)
 
     def mirror_x(self) -> Point:
         return Point(-self.x, self.y, self.z)
@@ -150,17 +185,18 @@ class Point:
 
     def unit(self) -> Point:
         """Treating this point as a vector, return a new vector of length 1.0"""
-        factor = 1.0 / self.length()
-        return Point(self.x * factor, self.y * factor, self.z * factor)
+        x = self.x
+        y = self.y
+        z = self.z
+        factor = 1.0 / math.hypot(x, y, z)
+        return Point(x * factor, y * factor, z * factor)
 
     def length(self) -> float:
         """Return the distance from this point to the origin."""
-        return math.sqrt(
-            (self.x * self.x) + (self.y * self.y) + (self.z * self.z)
-        )
+        return math.hypot(self.x, self.y, self.z)
 
     def __hash__(self) -> int:
-        return hash(self.as_tuple())
+        return hash((self.x, self.y, self.z))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Point):
@@ -186,6 +222,10 @@ class Point:
         """Return the dot product"""
         return (self.x * p.x) + (self.y * p.y) + (self.z * p.z)
 
+    def fma(self, v: Point, n: float) -> Point:
+        """Return self + (v * n), without allocating an intermediate Point"""
+        return Point(self.x + v.x * n, self.y + v.y * n, self.z + v.z * n)
+
     def xy(self) -> Point2D:
         """A Point2D containing just the X and Y coordinates from this point"""
         return Point2D(self.x, self.y)
@@ -220,15 +260,17 @@ class Point2D:
 
     def unit(self) -> Point2D:
         """Treating this point as a vector, return a new vector of length 1.0"""
-        factor = 1.0 / self.length()
-        return Point2D(self.x * factor, self.y * factor)
+        x = self.x
+        y = self.y
+        factor = 1.0 / math.hypot(x, y)
+        return Point2D(x * factor, y * factor)
 
     def length(self) -> float:
         """Return the distance from this point to the origin."""
-        return math.sqrt((self.x * self.x) + (self.y * self.y))
+        return math.hypot(self.x, self.y)
 
     def __hash__(self) -> int:
-        return hash(self.as_tuple())
+        return hash((self.x, self.y))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Point2D):
@@ -254,6 +296,10 @@ class Point2D:
         """Return the dot product"""
         return (self.x * p.x) + (self.y * p.y)
 
+    def fma(self, v: Point2D, n: float) -> Point2D:
+        """Return self + (v * n), without allocating an intermediate Point2D"""
+        return Point2D(self.x + v.x * n, self.y + v.y * n)
+
 
 class Plane:
     __slots__ = ["p0", "p1", "p2"]
@@ -265,19 +311,28 @@ class Plane:
 
     def normal(self) -> Point:
         """Compute the unit normal vector of the plane."""
+        n = self._normal_impl()
         try:
-            return self._normal_impl().unit() * -1.0
+            factor = -1.0 / n.length()
         except ZeroDivisionError:
             # All 3 points lie along the same line
             raise ValueError("cannot compute the normal of a degenerate plane")
+        return Point(n.x * factor, n.y * factor, n.z * factor)
 
     def _normal_impl(self) -> Point:
-        da = self.p1 - self.p0
-        db = self.p2 - self.p0
+        p0 = self.p0
+        p1 = self.p1
+        p2 = self.p2
+        dax = p1.x - p0.x
+        day = p1.y - p0.y
+        daz = p1.z - p0.z
+        dbx = p2.x - p0.x
+        dby = p2.y - p0.y
+        dbz = p2.z - p0.z
         return Point(
-            da.y * db.z - da.z * db.y,
-            da.z * db.x - da.x * db.z,
-            da.x * db.y - da.y * db.x,
+            day * dbz - daz * dby,
+            daz * dbx - dax * dbz,
+            dax * dby - day * dbx,
         )
 
     def intersect_line(self, line0: Point, line1: Point) -> Optional[Point]:
@@ -289,15 +344,31 @@ class Plane:
         """
         # Compute the plane's normal vector
         normal = self._normal_impl()
-
-        line_vector = line1 - line0
-        dot = normal.dot(line_vector)
+        nx = normal.x
+        ny = normal.y
+        nz = normal.z
+
+        vx = line1.x - line0.x
+        vy = line1.y - line0.y
+        vz = line1.z - line0.z
+        dot = nx * vx + ny * vy + nz * vz
         if dot == 0.0:
             return None
 
-        w = line0 - self.p0
-        fraction = -normal.dot(w) / dot
-        return line0 + (line_vector * fraction)
+        p0 = self.p0
+        fraction = (
+            -(
+                nx * (line0.x - p0.x)
+                + ny * (line0.y - p0.y)
+                + nz * (line0.z - p0.z)
+            )
+            / dot
+        )
+        return Point(
+            line0.x + vx * fraction,
+            line0.y + vy * fraction,
+            line0.z + vz * fraction,
+        )
 
     def z_intersect(self, x: float, y: float) -> float:
         """Given an X, Y position, return the Z coordinates of the plane at
@@ -314,8 +385,12 @@ class Plane:
         """Return a new plane that is parallel to this plane,
         but shifted along the normal by the specified amount.
         """
-        v = self.normal() * offset
-        return Plane(self.p0 + v, self.p1 + v, self.p2 + v)
+        n = self.normal()
+        return Plane(
+            self.p0.fma(n, offset),
+            self.p1.fma(n, offset),
+            self.p2.fma(n, offset),
+        )
 
     def intersect_plane(self, plane: Plane) -> Optional[Tuple[Point, Point]]:
         """Return the line created by the intersection of this plane with
@@ -323,21 +398,33 @@ class Plane:
 
         Returns None if the two planes are parallel.
         """
-        p0 = self.intersect_line(plane.p0, plane.p1)
-        if p0 is None:
-            p0 = self.intersect_line(plane.p0, plane.p2)
-            if p0 is None:
-                return None
-            p1 = self.intersect_line(plane.p1, plane.p2)
-        else:
-            p1 = self.intersect_line(plane.p0, plane.p2)
-            if p1 is None:
-                p1 = self.intersect_line(plane.p1, plane.p2)
-
-        if p1 is None:
+        n1 = self._normal_impl()
+        n2 = plane._normal_impl()
+
+        # The line runs along the cross product of the two normals
+        ux = n1.y * n2.z - n1.z * n2.y
+        uy = n1.z * n2.x - n1.x * n2.z
+        uz = n1.x * n2.y - n1.y * n2.x
+        u_len_sq = ux * ux + uy * uy + uz * uz
+        if u_len_sq == 0.0:
+            # The planes are parallel (or one of them is degenerate)
             return None
 
-        return (p0, p1)
+        # Each plane is the set of points x where n.dot(x) == d
+        d1 = n1.dot(self.p0)
+        d2 = n2.dot(plane.p0)
+
+        # The point on the line closest to the origin is
+        #   (d1 * (n2 x u) + d2 * (u x n1)) / |u|^2
+        ax = d1 * n2.x - d2 * n1.x
+        ay = d1 * n2.y - d2 * n1.y
+        az = d1 * n2.z - d2 * n1.z
+        p0 = Point(
+            (ay * uz - az * uy) / u_len_sq,
+            (az * ux - ax * uz) / u_len_sq,
+            (ax * uy - ay * ux) / u_len_sq,
+        )
+        return (p0, Point(p0.x + ux, p0.y + uy, p0.z + uz))
 
     def rotation_off_z(self) -> Point:
         """
@@ -352,9 +439,19 @@ class Plane:
 
         The Z component of the returned point is always 0.0.
         """
-        norm = self.normal()
-        x_angle = math.acos(norm.z / math.sqrt((norm.y ** 2) + (norm.z ** 2)))
-        y_angle = math.acos(norm.z / math.sqrt((norm.x ** 2) + (norm.z ** 2)))
+        # The normal() vector is the negation of _normal_impl().  atan2()
+        # does not need the vector to be normalized, so use the raw cross
+        # product with its sign flipped.
+        cross = self._normal_impl()
+        if cross.x == 0.0 and cross.y == 0.0 and cross.z == 0.0:
+            raise ValueError(
+                "cannot compute the rotation of a degenerate plane"
+            )
+        # Rotating by x_angle around the X axis moves the Z axis to
+        # (0, -sin(x_angle), cos(x_angle)), and rotating by y_angle around
+        # the Y axis moves it to (sin(y_angle), 0, cos(y_angle)).
+        x_angle = math.atan2(cross.y, -cross.z)
+        y_angle = math.atan2(-cross.x, -cross.z)
         return Point(x_angle, y_angle, 0.0)
 
 
@@ -382,15 +479,17 @@ class Line2D:
 
     def normal(self) -> Point2D:
         """Compute the normal vector of this line."""
-        v = self.vector()
-        return Point2D(v.y, -v.x).unit()
+        vx = self.p1.x - self.p0.x
+        vy = self.p1.y - self.p0.y
+        factor = 1.0 / math.hypot(vx, vy)
+        return Point2D(vy * factor, -vx * factor)
 
     def shifted_along_normal(self, offset: float) -> Line2D:
         """Return a new line that is parallel to this line,
         but shifted along the normal by the specified amount.
         """
-        v = self.normal() * offset
-        return Line2D(self.p0 + v, self.p1 + v)
+        n = self.normal()
+        return Line2D(self.p0.fma(n, offset), self.p1.fma(n, offset))
 
     def as_slope_intercept(self) -> Tuple[float, float]:
         """Return the slope and intercept of this line,
@@ -415,18 +514,20 @@ class Line2D:
         Returns None if the two lines are parallel to each other.
         """
         # Compute this line's normal vector
-        v = self.vector()
-        normal = Point2D(v.y, -v.x)
-
-        otherv = other.vector()
-        dot = normal.dot(otherv)
+        p0 = self.p0
+        nx = self.p1.y - p0.y
+        ny = p0.x - self.p1.x
+
+        o0 = other.p0
+        ovx = other.p1.x - o0.x
+        ovy = other.p1.y - o0.y
+        dot = nx * ovx + ny * ovy
         if dot == 0.0:
             # These lines are parallel
             return None
 
-        w = other.p0 - self.p0
-        fraction = -normal.dot(w) / dot
-        return other.p0 + (otherv * fraction)
+        fraction = -(nx * (o0.x - p0.x) + ny * (o0.y - p0.y)) / dot
+        return Point2D(o0.x + ovx * fraction, o0.y + ovy * fraction)
 
     def angle(self, other: Line2D) -> float:
         """Compute the angle between this line and another line.
@@ -435,15 +536,12 @@ class Line2D:
         """
         selfv = self.vector()
         otherv = other.vector()
-        num = selfv.x * otherv.x + selfv.y * otherv.y
-        denom = self.length() * other.length()
-        try:
-            return math.acos(num / denom)
-        except ValueError:
-            # Floating point error can result in denom sometimes being very
-            # slightly larger than num, resulting in an domain error when the
-            # result should actually be 0.0.
-            return 0.0
+        dot = selfv.x * otherv.x + selfv.y * otherv.y
+        det = selfv.x * otherv.y - selfv.y * otherv.x
+        # atan2() stays accurate for angles near 0 and pi, where
+        # acos(dot / (len0 * len1)) loses precision or falls outside the
+        # domain of acos() due to rounding.
+        return math.atan2(abs(det), dot)
 
     def angle_full(self, other: Line2D) -> float:
         """Compute the angle between this line and another line.
@@ -457,6 +555,20 @@ class Line2D:
         return math.atan2(det, dot)
 
 
+# The upper-left 3x3 portion of an identity matrix, in row-major order
+_IDENTITY_3X3: Tuple[float, ...] = (
+    1.0,
+    0.0,
+    0.0,
+    0.0,
+    1.0,
+    0.0,
+    0.0,
+    0.0,
+    1.0,
+)
+
+
 class MeshPoint:
     __slots__ = ["mesh", "_index", "point"]
     mesh: Mesh
@@ -496,6 +608,17 @@ class MeshPoint:
         return self.point.z
 
 
+def _point_indices(points: List[MeshPoint]) -> List[int]:
+    """Return the indices of the specified points, assigning indices in
+    order to any points that do not have one yet.
+    """
+    indices = [p._index for p in points]
+    if None in indices:
+        return [p.index for p in points]
+    # pyre-fixme[7]: None was ruled out above
+    return indices
+
+
 class Mesh:
     def __init__(self) -> None:
         self.points: List[MeshPoint] = []
@@ -516,22 +639,111 @@ class Mesh:
     def add_xyz(self, x: float, y: float, z: float) -> MeshPoint:
         return self.add_point(Point(x, y, z))
 
+    def add_xyz_batch(
+        self, coords: Iterable[Tuple[float, float, float]]
+    ) -> List[MeshPoint]:
+        """Add several points at once.
+
+        This is equivalent to calling add_xyz() for each coordinate tuple,
+        and returns the new points in the same order.
+        """
+        new_points = [MeshPoint(self, Point(x, y, z)) for (x, y, z) in coords]
+        self.all_points.extend(new_points)
+        return new_points
+
+    def flat_coords(self) -> List[float]:
+        """Return the coordinates of self.points as a flat list.
+
+        The result contains the X, Y, and Z values of each point in index
+        order.  This is the layout expected by bulk consumers such as
+        Blender's foreach_set() APIs.
+        """
+        coords: List[float] = []
+        extend = coords.extend
+        for mp in self.points:
+            p = mp.point
+            extend((p.x, p.y, p.z))
+        return coords
+
+    def write_binary_stl(self, path: Union[str, Path]) -> None:
+        """Write this mesh directly to a binary STL file.
+
+        Faces with more than 3 points are split into a fan of triangles, so
+        they should be convex.  This does not go through blender at all, so
+        it is only useful for meshes that do not need any further blender
+        operations (booleans, bevels, etc) before export.
+        """
+        tri_verts: List[int] = []
+        extend = tri_verts.extend
+        for face in self.faces:
+            # Our faces use the opposite winding order from STL
+            f0 = face[-1]
+            for idx in range(len(face) - 2, 0, -1):
+                extend((f0, face[idx], face[idx - 1]))
+        stl.write_binary_stl(Path(path), self.flat_coords(), tri_verts)
+
+    def _add_indexed_xyz(self, x: float, y: float, z: float) -> int:
+        """Add a point and immediately assign it the next index in
+        self.points.
+
+        Returns the point's index, which can be used directly in face tuples
+        appended to self.faces.
+        """
+        mp = MeshPoint(self, point=Point(x, y, z))
+        index = len(self.points)
+        mp._index = index
+        self.points.append(mp)
+        self.all_points.append(mp)
+        return index
+
+    def _extend_indexed_xyz(
+        self, coords: Iterable[Tuple[float, float, float]]
+    ) -> range:
+        """Add several points, immediately assigning them consecutive
+        indices in self.points.
+
+        Returns the range of indices assigned to the new points.
+        """
+        start = len(self.points)
+        new_points = [MeshPoint(self, Point(x, y, z)) for (x, y, z) in coords]
+        for index, mp in enumerate(new_points, start):
+            mp._index = index
+        self.points.extend(new_points)
+        self.all_points.extend(new_points)
+        return range(start, len(self.points))
+
+    # The face methods below read MeshPoint._index directly, and only fall
+    # back to the lazily-assigning MeshPoint.index property when needed.
+
     def add_tri(self, p0: MeshPoint, p1: MeshPoint, p2: MeshPoint) -> int:
         index = len(self.faces)
-        self.faces.append((p0.index, p1.index, p2.index))
+        i0 = p0._index
+        i1 = p1._index
+        i2 = p2._index
+        if i0 is None or i1 is None or i2 is None:
+            self.faces.append((p0.index, p1.index, p2.index))
+        else:
+            self.faces.append((i0, i1, i2))
         return index
 
     def add_quad(
         self, p0: MeshPoint, p1: MeshPoint, p2: MeshPoint, p3: MeshPoint
     ) -> int:
         index = len(self.faces)
-        self.faces.append((p0.index, p1.index, p2.index, p3.index))
+        i0 = p0._index
+        i1 = p1._index
+        i2 = p2._index
+        i3 = p3._index
+        if i0 is None or i1 is None or i2 is None or i3 is None:
+            self.faces.append((p0.index, p1.index, p2.index, p3.index))
+        else:
+            self.faces.append((i0, i1, i2, i3))
         return index
 
     def add_face(self, points: Iterable[MeshPoint]) -> int:
         """Add a face with an arbitrary number of vertices."""
         index = len(self.faces)
-        self.faces.append([p.index for p in points])
+        self.faces.append(_point_indices(list(points)))
         return index
 
     def add_fan(self, p0: MeshPoint, points: Iterable[MeshPoint]) -> None:
@@ -539,36 +751,85 @@ class Mesh:
         Add a sequence of triangular faces, fanned out from p0 to each of the
         other points.
         """
-        prev: Optional[MeshPoint] = None
-        for p in points:
-            if prev is not None:
-                self.add_tri(p0, prev, p)
-            prev = p
+        pts = list(points)
+        if len(pts) < 2:
+            return
+        idx0 = p0.index
+        indices = _point_indices(pts)
+        self.faces.extend(
+            (idx0, prev, cur) for prev, cur in zip(indices, indices[1:])
+        )
 
     def transform(self, tf: Transform) -> None:
+        # Extract the matrix elements once, rather than going through
+        # mathutils for every point in the mesh.
+        (
+            (m00, m01, m02, m03),
+            (m10, m11, m12, m13),
+            (m20, m21, m22, m23),
+        ) = tf._affine_rows()
+        linear = (m00, m01, m02, m10, m11, m12, m20, m21, m22)
+        if linear == _IDENTITY_3X3:
+            if m03 == 0.0 and m13 == 0.0 and m23 == 0.0:
+                # The identity transform
+                return
+            # A pure translation, as from Mesh.translate().
+            # Skip the multiplies.
+            for mp in self.all_points:
+                p = mp.point
+                mp.point = Point(p.x + m03, p.y + m13, p.z + m23)
+            return
+
         for mp in self.all_points:
-            mp.point = mp.point.transform(tf)
+            p = mp.point
+            x = p.x
+            y = p.y
+            z = p.z
+            mp.point = Point(
+                m00 * x + m01 * y + m02 * z + m03,
+                m10 * x + m11 * y + m12 * z + m13,
+                m20 * x + m21 * y + m22 * z + m23,
+            )
 
     def rotate(self, x: float, y: float, z: float) -> None:
-        tf = Transform().rotate(x, y, z)
-        self.transform(tf)
+        self.rotate_degrees(x, y, z)
 
     def rotate_degrees(self, x: float, y: float, z: float) -> None:
-        tf = Transform().rotate_degrees(x, y, z)
-        self.transform(tf)
+        self.rotate_radians(math.radians(x), math.radians(y), math.radians(z))
 
     def rotate_radians(self, x: float, y: float, z: float) -> None:
+        if x == 0.0 and y == 0.0 and z == 0.0:
+            return
         tf = Transform().rotate_radians(x, y, z)
         self.transform(tf)
 
     def translate(self, x: float, y: float, z: float) -> None:
+        if x == 0.0 and y == 0.0 and z == 0.0:
+            return
         tf = Transform().translate(x, y, z)
         self.transform(tf)
 
+    def rotate_translate(
+        self,
+        rotation: Tuple[float, float, float],
+        offset: Tuple[float, float, float],
+    ) -> None:
+        """Rotate the mesh by the specified X, Y, and Z angles in degrees,
+        and then translate it by the specified offset.
+
+        This is equivalent to calling rotate() followed by translate(), but
+        only makes a single pass over the points.
+        """
+        tf = Transform().rotate(*rotation).translate(*offset)
+        self.transform(tf)
+
     def mirror_x(self) -> None:
+        # Replace the Point objects rather than modifying them in place,
+        # the same as transform().  Points may be shared with other meshes.
         for mp in self.all_points:
-            mp.point.x = -1.0 * mp.x
-        self.faces = [tuple(reversed(face)) for face in self.faces]
+            p = mp.point
+            mp.point = Point(-p.x, p.y, p.z)
+        self.faces = [face[::-1] for face in self.faces]
 
 
 def compute_angle(v0: Point, v1: Point) -> float:
@@ -576,9 +837,28 @@ def compute_angle(v0: Point, v1: Point) -> float:
 
     Returns the value in radians.
     """
-    num = v0.x * v1.x + v0.y * v1.y + v0.z * v1.z
-    denom = v0.length() * v1.length()
-    return math.acos(num / denom)
+    x0 = v0.x
+    y0 = v0.y
+    z0 = v0.z
+    x1 = v1.x
+    y1 = v1.y
+    z1 = v1.z
+    cx = y0 * z1 - z0 * y1
+    cy = z0 * x1 - x0 * z1
+    cz = x0 * y1 - y0 * x1
+    dot = x0 * x1 + y0 * y1 + z0 * z1
+    return math.atan2(math.hypot(cx, cy, cz), dot)
+
+
+# The face indices for the points created by cube()
+_CUBE_FACES: Tuple[Tuple[int, int, int, int], ...] = (
+    (0, 1, 2, 3),
+    (4, 5, 6, 7),
+    (6, 5, 3, 2),
+    (7, 6, 2, 1),
+    (4, 7, 1, 0),
+    (5, 4, 0, 3),
+)
 
 
 def cube(
@@ -606,22 +886,17 @@ def cube(
         z1 = z[1]
 
     mesh = Mesh()
-    b_tl = mesh.add_xyz(x0, y1, z0)
-    b_tr = mesh.add_xyz(x1, y1, z0)
-    b_br = mesh.add_xyz(x1, y0, z0)
-    b_bl = mesh.add_xyz(x0, y0, z0)
-
-    t_tl = mesh.add_xyz(x0, y1, z1)
-    t_tr = mesh.add_xyz(x1, y1, z1)
-    t_br = mesh.add_xyz(x1, y0, z1)
-    t_bl = mesh.add_xyz(x0, y0, z1)
-
-    mesh.add_quad(b_tl, b_bl, b_br, b_tr)
-    mesh.add_quad(t_tl, t_tr, t_br, t_bl)
-    mesh.add_quad(t_br, t_tr, b_tr, b_br)
-    mesh.add_quad(t_bl, t_br, b_br, b_bl)
-    mesh.add_quad(t_tl, t_bl, b_bl, b_tl)
-    mesh.add_quad(t_tr, t_tl, b_tl, b_tr)
+    # The points are added in the same order as their indices in
+    # _CUBE_FACES
+    mesh._add_indexed_xyz(x0, y1, z0)  # bottom top-left
+    mesh._add_indexed_xyz(x0, y0, z0)  # bottom bottom-left
+    mesh._add_indexed_xyz(x1, y0, z0)  # bottom bottom-right
+    mesh._add_indexed_xyz(x1, y1, z0)  # bottom top-right
+    mesh._add_indexed_xyz(x0, y1, z1)  # top top-left
+    mesh._add_indexed_xyz(x1, y1, z1)  # top top-right
+    mesh._add_indexed_xyz(x1, y0, z1)  # top bottom-right
+    mesh._add_indexed_xyz(x0, y0, z1)  # top bottom-left
+    mesh.faces.extend(_CUBE_FACES)
 
     return mesh
 
@@ -679,6 +954,16 @@ def wedge(
     return mesh
 
 
+def _unit_circle(
+    rotation: float, fn: int, count: int
+) -> List[Tuple[float, float]]:
+    """Return the (sin, cos) values for count steps around a circle,
+    where each step is 1/fn of the specified rotation in degrees.
+    """
+    step = math.radians(rotation) / fn
+    return [(math.sin(step * n), math.cos(step * n)) for n in range(count)]
+
+
 def cylinder(
     r: float,
     h: Union[float, Tuple[float, float]],
@@ -701,44 +986,43 @@ def cylinder(
         end = fn + 1
 
     mesh = Mesh()
-    top_center = mesh.add_xyz(0.0, 0.0, top_z)
-    bottom_center = mesh.add_xyz(0.0, 0.0, bottom_z)
-    top_points: List[MeshPoint] = []
-    bottom_points: List[MeshPoint] = []
-
-    rotation_rads = math.radians(rotation)
-    for n in range(end):
-        angle = (rotation_rads / fn) * n
-
-        top_x = math.sin(angle) * r
-        top_y = math.cos(angle) * r
-        bottom_x = math.sin(angle) * r2
-        bottom_y = math.cos(angle) * r2
-
-        top_points.append(mesh.add_xyz(top_x, top_y, top_z))
-        bottom_points.append(mesh.add_xyz(bottom_x, bottom_y, bottom_z))
-
-    for idx in range(1, len(top_points)):
-        # Note: this intentionally wraps around to -1 when idx == 0
-        prev_f = top_points[idx - 1]
-        prev_b = bottom_points[idx - 1]
-
-        mesh.add_tri(top_center, prev_f, top_points[idx])
-        mesh.add_tri(bottom_center, bottom_points[idx], prev_b)
-        mesh.add_quad(prev_f, prev_b, bottom_points[idx], top_points[idx])
+    top_center = mesh._add_indexed_xyz(0.0, 0.0, top_z)
+    bottom_center = mesh._add_indexed_xyz(0.0, 0.0, bottom_z)
+    # Compute the unit circle once, and scale it for the top and bottom
+    circle = _unit_circle(rotation, fn, end)
+    top_points = mesh._extend_indexed_xyz(
+        (sin_a * r, cos_a * r, top_z) for (sin_a, cos_a) in circle
+    )
+    bottom_points = mesh._extend_indexed_xyz(
+        (sin_a * r2, cos_a * r2, bottom_z) for (sin_a, cos_a) in circle
+    )
+
+    # Each entry is (prev_top, cur_top, prev_bottom, cur_bottom)
+    steps = list(
+        zip(top_points, top_points[1:], bottom_points, bottom_points[1:])
+    )
+    faces = mesh.faces
+    faces.extend((top_center, pt, ct) for (pt, ct, pb, cb) in steps)
+    faces.extend((bottom_center, cb, pb) for (pt, ct, pb, cb) in steps)
+    faces.extend((pt, pb, cb, ct) for (pt, ct, pb, cb) in steps)
 
     if rotation >= 360.0:
-        mesh.add_tri(top_center, top_points[-1], top_points[0])
-        mesh.add_tri(bottom_center, bottom_points[0], bottom_points[-1])
-        mesh.add_quad(
-            top_points[-1], bottom_points[-1], bottom_points[0], top_points[0]
+        faces.append((top_center, top_points[-1], top_points[0]))
+        faces.append((bottom_center, bottom_points[0], bottom_points[-1]))
+        faces.append(
+            (
+                top_points[-1],
+                bottom_points[-1],
+                bottom_points[0],
+                top_points[0],
+            )
         )
     else:
-        mesh.add_quad(
-            top_center, bottom_center, bottom_points[0], top_points[0]
+        faces.append(
+            (top_center, bottom_center, bottom_points[0], top_points[0])
         )
-        mesh.add_quad(
-            top_center, top_points[-1], bottom_points[-1], bottom_center
+        faces.append(
+            (top_center, top_points[-1], bottom_points[-1], bottom_center)
         )
 
     return mesh
@@ -755,31 +1039,24 @@ def cone(r: float, h: float, fn: int = 24, rotation: float = 360.0) -> Mesh:
         end = fn + 1
 
     mesh = Mesh()
-    top_center = mesh.add_xyz(0.0, 0.0, top_z)
-    bottom_center = mesh.add_xyz(0.0, 0.0, bottom_z)
-    bottom_points: List[MeshPoint] = []
-
-    rotation_rads = math.radians(rotation)
-    for n in range(end):
-        angle = (rotation_rads / fn) * n
-        circle_x = math.sin(angle) * r
-        circle_y = math.cos(angle) * r
-
-        bottom_points.append(mesh.add_xyz(circle_x, circle_y, bottom_z))
-
-    for idx in range(1, len(bottom_points)):
-        # Note: this intentionally wraps around to -1 when idx == 0
-        prev_b = bottom_points[idx - 1]
-
-        mesh.add_tri(bottom_center, bottom_points[idx], prev_b)
-        mesh.add_tri(prev_b, bottom_points[idx], top_center)
+    top_center = mesh._add_indexed_xyz(0.0, 0.0, top_z)
+    bottom_center = mesh._add_indexed_xyz(0.0, 0.0, bottom_z)
+    bottom_points = mesh._extend_indexed_xyz(
+        (sin_a * r, cos_a * r, bottom_z)
+        for (sin_a, cos_a) in _unit_circle(rotation, fn, end)
+    )
+
+    steps = list(zip(bottom_points, bottom_points[1:]))
+    faces = mesh.faces
+    faces.extend((bottom_center, cur, prev) for (prev, cur) in steps)
+    faces.extend((prev, cur, top_center) for (prev, cur) in steps)
 
     if rotation >= 360.0:
-        mesh.add_tri(bottom_center, bottom_points[0], bottom_points[-1])
-        mesh.add_tri(bottom_points[-1], bottom_points[0], top_center)
+        faces.append((bottom_center, bottom_points[0], bottom_points[-1]))
+        faces.append((bottom_points[-1], bottom_points[0], top_center))
     else:
-        mesh.add_tri(bottom_center, bottom_points[0], top_center)
-        mesh.add_tri(top_center, bottom_points[-1], bottom_center)
+        faces.append((bottom_center, bottom_points[0], top_center))
+        faces.append((top_center, bottom_points[-1], bottom_center))
 
     return mesh
 
@@ -795,18 +1072,29 @@ def bezier(
     heading towards ctrl0, and approaching the end point from the direction of
     ctrl1.
     """
+    # Read the control point coordinates once, outside of the loop
+    (sx, sy, sz) = (start.x, start.y, start.z)
+    (c0x, c0y, c0z) = (ctrl0.x, ctrl0.y, ctrl0.z)
+    (c1x, c1y, c1z) = (ctrl1.x, ctrl1.y, ctrl1.z)
+    (ex, ey, ez) = (end.x, end.y, end.z)
+
     results: List[Point] = []
     tscale = 1.0 / (npoints - 1)
     for idx in range(npoints):
         t = idx * tscale
         nt = 1.0 - t
-        b = (
-            (start * (nt ** 3))
-            + (ctrl0 * (3 * nt * nt * t))
-            + (ctrl1 * (3 * nt * t * t))
-            + (end * (t ** 3))
+        # Bernstein basis weights for this t value
+        w0 = nt * nt * nt
+        w1 = 3 * nt * nt * t
+        w2 = 3 * nt * t * t
+        w3 = t * t * t
+        results.append(
+            Point(
+                sx * w0 + c0x * w1 + c1x * w2 + ex * w3,
+                sy * w0 + c0y * w1 + c1y * w2 + ey * w3,
+                sz * w0 + c0z * w1 + c1z * w2 + ez * w3,
+            )
         )
-        results.append(b)
 
     return results
 
@@ -9,13 +9,16 @@ To use, run "blender -b -P generate_stl.py"
 
 from __future__ import annotations
 
-from . import blender_util
+from . import blender_util, stl
 import bpy
 
 import argparse
+import array
+import concurrent.futures
+import subprocess
 import sys
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # A dictionary mapping names to functions that generate objects to export.
 #
@@ -87,6 +90,21 @@ def main(
     ap.add_argument(
         "--all", action="store_true", help="Export all available targets."
     )
+    ap.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Export up to N targets in parallel, each in a separate "
+        "blender process.",
+    )
+    ap.add_argument(
+        "-z",
+        "--gzip",
+        action="store_true",
+        help="Write gzip-compressed .stl.gz files.",
+    )
     args = ap.parse_args(blender_util.get_script_args())
 
     if args.list:
@@ -94,13 +112,15 @@ def main(
         # so print a header line to help distinguish our model name output
         # from other messages already printed by blender.
         print("\n= Available Targets =\n")
-        for name in sorted(targets.keys()):
-            print(f"{name}")
+        print("\n".join(sorted(targets)))
         sys.exit(0)
 
+    if args.jobs < 1:
+        ap.error("--jobs must be at least 1")
+
+    main_module = sys.modules.get("__main__", None)
+    main_path: Optional[str] = getattr(main_module, "__file__", None)
     if args.output_dir is None:
-        main_module = sys.modules.get("__main__", None)
-        main_path = getattr(main_module, "__file__", None)
         if main_path is None:
             ap.error(
                 "no --output-dir specified and unable to determine script path"
@@ -121,35 +141,152 @@ def main(
             ap.error(f"unknown target: {unknown_names_str}")
     elif args.all:
         # Execute all targets
-        target_names = sorted(targets.keys())
+        target_names = sorted(targets)
     elif default is None:
         ap.error(f"no target specified.  Use --list to see available targets.")
     else:
         target_names = default[:]
 
+    if args.jobs > 1 and len(target_names) > 1:
+        if main_path is None:
+            ap.error("--jobs requires the script path to be known")
+        _export_in_subprocesses(
+            main_path, target_names, out_dir, args.jobs, args.gzip
+        )
+        return
+
+    suffix = ".stl.gz" if args.gzip else ".stl"
     blender_util.set_view_distance(350.0)
     for target_name in target_names:
-        print(f"Exporting target {target_name}...")
-        blender_util.delete_all()
-
-        fn = targets[target_name]
-        obj = fn()
-        if isinstance(obj, bpy.types.Object):
-            # Export the one object that was returned
-            out_path = out_dir / f"{target_name}.stl"
-            export_object(obj, out_path)
+        _export_target(targets, target_name, out_dir, suffix)
+
+    # Free the data left behind by the models, such as the meshes of
+    # boolean operands.  This is done once at the end rather than per target,
+    # since it has to scan all of the data in the file.
+    bpy.data.orphans_purge(do_recursive=True)
+
+
+def _export_target(
+    targets: TargetDict, target_name: str, out_dir: Path, suffix: str
+) -> None:
+    print(f"Exporting target {target_name}...")
+    blender_util.delete_all()
+
+    fn = targets[target_name]
+    obj = fn()
+    if isinstance(obj, bpy.types.Object):
+        # Export the one object that was returned
+        out_path = out_dir / f"{target_name}{suffix}"
+        export_object(obj, out_path)
+        print(f"Wrote {out_path}...")
+    else:
+        # Export all defined objects
+        exports = [
+            (obj, out_dir / f"{obj.name}{suffix}") for obj in bpy.data.objects
+        ]
+        export_objects(exports)
+        for _obj, out_path in exports:
             print(f"Wrote {out_path}...")
-        else:
-            # Export all defined objects
-            for obj in bpy.data.objects:
-                out_path = out_dir / f"{obj.name}.stl"
-                export_object(obj, out_path)
-                print(f"Wrote {out_path}...")
+
+
+def _export_in_subprocesses(
+    script_path: str,
+    target_names: List[str],
+    out_dir: Path,
+    jobs: int,
+    compress: bool,
+) -> None:
+    """Export each target by re-running the script in a separate process.
+
+    Each process starts with an empty scene and only builds a single
+    target, and up to `jobs` processes are run at once.
+    """
+    if bpy.app.binary_path:
+        # Running inside the blender application
+        cmd_prefix = [
+            bpy.app.binary_path,
+            "-b",
+            "--python-exit-code",
+            "1",
+            "-P",
+            script_path,
+            "--",
+        ]
+    else:
+        # Running with bpy imported as a module in a normal python process
+        cmd_prefix = [sys.executable, script_path, "--"]
+    cmd_prefix += ["-o", str(out_dir.resolve())]
+    if compress:
+        cmd_prefix.append("--gzip")
+
+    def run(target_name: str) -> int:
+        return subprocess.run(cmd_prefix + [target_name]).returncode
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(run, target_names))
+
+    failed = [name for name, rc in zip(target_names, results) if rc != 0]
+    if failed:
+        failed_str = ", ".join(failed)
+        print(f"error: failed to export: {failed_str}", file=sys.stderr)
+        sys.exit(1)
 
 
 def export_object(obj: bpy.types.Object, path: Path) -> None:
-    bpy.ops.object.mode_set(mode="OBJECT")
-    bpy.ops.object.select_all(action="DESELECT")
-    obj.select_set(True)
+    """Write an object to a binary STL file.
+
+    This writes the file directly from the object's evaluated mesh data
+    rather than going through the STL export operator, which avoids the
+    operator's selection, undo and scene update overhead for each object.
+    """
+    export_objects([(obj, path)])
+
+
+def export_objects(exports: Sequence[Tuple[bpy.types.Object, Path]]) -> None:
+    """Write several objects to binary STL files.
+
+    exports is a sequence of (object, path) pairs.  The evaluated
+    dependency graph is only fetched once for all of the objects.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj, path in exports:
+        _export_evaluated(obj.evaluated_get(depsgraph), path)
+
+
+def _export_evaluated(eval_obj: bpy.types.Object, path: Path) -> None:
+    mesh = eval_obj.to_mesh()
+    try:
+        # Export in world coordinates, the same as the STL operator does.
+        matrix = eval_obj.matrix_world
+        mesh.transform(matrix)
+        mesh.calc_loop_triangles()
+        write_mesh_stl(mesh, path, flip=matrix.is_negative)
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+def write_mesh_stl(
+    mesh: bpy.types.Mesh, path: Path, flip: bool = False
+) -> None:
+    """Write a mesh's loop triangles to a binary STL file.
+
+    mesh.calc_loop_triangles() must have been called first.  If flip is
+    True the vertex order of each triangle is reversed.
+    """
+    num_verts = len(mesh.vertices)
+    num_tris = len(mesh.loop_triangles)
+
+    coords = array.array("f", bytes(num_verts * 3 * 4))
+    mesh.vertices.foreach_get("co", coords)
+    tri_verts = array.array("i", bytes(num_tris * 3 * 4))
+    mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    normals = array.array("f", bytes(num_tris * 3 * 4))
+    mesh.loop_triangles.foreach_get("normal", normals)
+
+    if flip:
+        # Swap the second and third vertex of each triangle, and point the
+        # normals the other way.
+        (tri_verts[1::3], tri_verts[2::3]) = (tri_verts[2::3], tri_verts[1::3])
+        normals = array.array("f", [-n for n in normals])
 
-    bpy.ops.export_mesh.stl(filepath=str(path), use_selection=True)
+    stl.write_binary_stl(path, coords, tri_verts, normals)
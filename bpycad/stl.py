@@ -0,0 +1,171 @@
+#!/usr/bin/python3 -tt
+#
+# Copyright (c) 2023, Adam Simpkins
+#
+
+"""Functions for writing binary STL files.
+
+These operate on flat coordinate and index buffers, and do not depend on
+blender, so they can be used both for blender meshes and for cad.Mesh
+objects.
+"""
+
+from __future__ import annotations
+
+import array
+import gzip
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+# Each STL triangle record is the normal, the three vertex coordinates,
+# and a 2-byte attribute count that is always 0.
+_RECORD = struct.Struct("<12fH")
+_HEADER_SIZE = 84
+# The number of triangle records write_binary_stl() packs per write() call
+_CHUNK_TRIS = 8192
+
+
+def compute_normals(
+    coords: Sequence[float], tri_verts: Sequence[int]
+) -> array.array[float]:
+    """Compute the unit normal of each triangle.
+
+    coords contains the X, Y, and Z values of each vertex, and tri_verts
+    contains 3 vertex indices for each triangle.  The vertices of each
+    triangle are expected to be in counter-clockwise order when viewed from
+    outside.  Degenerate triangles get a (0, 0, 0) normal.
+    """
+    normals = array.array("d", bytes(len(tri_verts) * 8))
+    for base in range(0, len(tri_verts), 3):
+        v0 = tri_verts[base] * 3
+        v1 = tri_verts[base + 1] * 3
+        v2 = tri_verts[base + 2] * 3
+        ax = coords[v1] - coords[v0]
+        ay = coords[v1 + 1] - coords[v0 + 1]
+        az = coords[v1 + 2] - coords[v0 + 2]
+        bx = coords[v2] - coords[v0]
+        by = coords[v2 + 1] - coords[v0 + 1]
+        bz = coords[v2 + 2] - coords[v0 + 2]
+        nx = ay * bz - az * by
+        ny = az * bx - ax * bz
+        nz = ax * by - ay * bx
+        length = math.hypot(nx, ny, nz)
+        if length != 0.0:
+            normals[base] = nx / length
+            normals[base + 1] = ny / length
+            normals[base + 2] = nz / length
+    return normals
+
+
+def pack_binary_stl(
+    coords: Sequence[float],
+    tri_verts: Sequence[int],
+    normals: Sequence[float],
+) -> bytearray:
+    """Return the contents of a binary STL file for the specified triangles.
+
+    normals contains the X, Y, and Z components of each triangle's normal.
+    """
+    num_tris = len(tri_verts) // 3
+    data = bytearray(_HEADER_SIZE + num_tris * _RECORD.size)
+    struct.pack_into("<I", data, 80, num_tris)
+    _pack_records(data, _HEADER_SIZE, coords, tri_verts, normals, 0, num_tris)
+    return data
+
+
+def _pack_records(
+    data: bytearray,
+    offset: int,
+    coords: Sequence[float],
+    tri_verts: Sequence[int],
+    normals: Sequence[float],
+    start: int,
+    end: int,
+) -> None:
+    """Pack the records for triangles [start, end) into data at offset."""
+    pack_into = _RECORD.pack_into
+    record_size = _RECORD.size
+    for base in range(start * 3, end * 3, 3):
+        v0 = tri_verts[base] * 3
+        v1 = tri_verts[base + 1] * 3
+        v2 = tri_verts[base + 2] * 3
+        pack_into(
+            data,
+            offset,
+            normals[base],
+            normals[base + 1],
+            normals[base + 2],
+            coords[v0],
+            coords[v0 + 1],
+            coords[v0 + 2],
+            coords[v1],
+            coords[v1 + 1],
+            coords[v1 + 2],
+            coords[v2],
+            coords[v2 + 1],
+            coords[v2 + 2],
+            0,
+        )
+        offset += record_size
+
+
+def write_binary_stl(
+    path: Path,
+    coords: Sequence[float],
+    tri_verts: Sequence[int],
+    normals: Optional[Sequence[float]] = None,
+) -> None:
+    """Write triangles to a binary STL file.
+
+    If normals is None the triangle normals are computed from the vertex
+    winding order.
+
+    The triangle records are packed and written in fixed size chunks, so
+    the file contents are never held in memory all at once.
+
+    If path ends in ".gz" the file is gzip-compressed.  This uses the
+    fastest compression level: STL data compresses well even at that level,
+    and higher levels cost much more time for little extra benefit.
+    """
+    if normals is None:
+        normals = compute_normals(coords, tri_verts)
+
+    # Write to a temporary file and then rename it into place, so that an
+    # interrupted export never leaves a truncated STL file behind.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            if path.suffix == ".gz":
+                with gzip.GzipFile(
+                    filename=path.name, mode="wb", compresslevel=1, fileobj=f
+                ) as gz:
+                    _write_stl_data(gz.write, coords, tri_verts, normals)
+            else:
+                _write_stl_data(f.write, coords, tri_verts, normals)
+    except BaseException:
+        # Don't leave a partially written temporary file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+def _write_stl_data(
+    write: Callable[[memoryview], object],
+    coords: Sequence[float],
+    tri_verts: Sequence[int],
+    normals: Sequence[float],
+) -> None:
+    num_tris = len(tri_verts) // 3
+    header = bytearray(_HEADER_SIZE)
+    struct.pack_into("<I", header, 80, num_tris)
+    write(memoryview(header))
+
+    chunk = bytearray(_CHUNK_TRIS * _RECORD.size)
+    with memoryview(chunk) as view:
+        for start in range(0, num_tris, _CHUNK_TRIS):
+            end = min(start + _CHUNK_TRIS, num_tris)
+            _pack_records(chunk, 0, coords, tri_verts, normals, start, end)
+            write(view[: (end - start) * _RECORD.size])
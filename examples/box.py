@@ -4,7 +4,7 @@
 #
 
 from bpycad import blender_util
-from bpycad.cad import Mesh, MeshPoint, Plane
+from bpycad.cad import Line2D, Mesh, Point2D
 
 import bpy
 from typing import List
@@ -42,98 +42,84 @@ class CustomBox:
     def gen_walls(self) -> None:
         # Generate the walls.  We do this purely with a bpycad.cad.Mesh,
         # without creating a Blender object yet.
-        self.base_perim = [
-            self.mesh.add_xyz(x, y, 0.0) for x, y in self.perimeter
-        ]
-        self.upper_perim = [
-            self.mesh.add_xyz(x, y, self.height) for x, y in self.perimeter
-        ]
-        self.inner_base_perim: List[MeshPoint] = []
-        self.inner_upper_perim: List[MeshPoint] = []
+        mesh = self.mesh
+        perimeter = self.perimeter
+        height = self.height
         inner_h = self.height - self.wall_thickness
 
-        # Create the outer wall faces
-        for idx in range(len(self.base_perim)):
-            # Add the vertical outer wall
-            self.mesh.add_quad(
-                self.base_perim[idx],
-                self.upper_perim[idx],
-                self.upper_perim[idx - 1],
-                self.base_perim[idx - 1],
-            )
-
-            # Define the inner wall points
-            # Take the outer wall planes, move each inwards by wall_thickness,
-            # then find where the inner walls intersect to determine the
-            # inner perimeter points.
-            prev_wall_plane = Plane(
-                self.base_perim[idx].point,
-                self.base_perim[idx - 1].point,
-                self.upper_perim[idx].point,
-            )
-            next_idx = (idx + 1) % len(self.base_perim)
-            next_wall_plane = Plane(
-                self.base_perim[next_idx].point,
-                self.base_perim[idx].point,
-                self.upper_perim[idx].point,
-            )
-            prev_inner_wall_plane = prev_wall_plane.shifted_along_normal(
+        # The walls are all vertical, so the inner perimeter can be computed
+        # in 2D: shift each outer wall's line inwards by wall_thickness, then
+        # find where consecutive inner wall lines intersect.  Compute each
+        # inner wall line once, up front, since each one is used for two
+        # inner perimeter points.
+        # inner_walls[idx] is the wall between perimeter idx - 1 and idx
+        perim_2d = [Point2D(x, y) for x, y in perimeter]
+        inner_walls = [
+            Line2D(perim_2d[idx - 1], perim_2d[idx]).shifted_along_normal(
                 self.wall_thickness
             )
-            next_inner_wall_plane = next_wall_plane.shifted_along_normal(
-                self.wall_thickness
-            )
-            inner_edge = prev_inner_wall_plane.intersect_plane(
-                next_inner_wall_plane
-            )
-            if inner_edge is None:
+            for idx in range(len(perim_2d))
+        ]
+        inner_2d: List[Point2D] = []
+        for idx, prev_inner_wall in enumerate(inner_walls):
+            next_inner_wall = inner_walls[(idx + 1) % len(inner_walls)]
+            inner_point = prev_inner_wall.intersect(next_inner_wall)
+            if inner_point is None:
                 # The two walls are parallel.  There generally isn't any need
                 # to define two consecutive parallel walls, but handle this
                 # case anyway.
-                inner_point = self.base_perim[idx].point + (
-                    prev_wall_plane.normal() * self.wall_thickness
-                )
-            else:
-                inner_point = inner_edge[0]
-            self.inner_base_perim.append(
-                self.mesh.add_xyz(inner_point.x, inner_point.y, 0.0)
-            )
-            self.inner_upper_perim.append(
-                self.mesh.add_xyz(inner_point.x, inner_point.y, inner_h)
+                inner_point = prev_inner_wall.p1
+            inner_2d.append(inner_point)
+
+        # Create all of the perimeter points up front
+        base_perim = mesh.add_xyz_batch((x, y, 0.0) for x, y in perimeter)
+        upper_perim = mesh.add_xyz_batch((x, y, height) for x, y in perimeter)
+        inner_base_perim = mesh.add_xyz_batch(
+            (p.x, p.y, 0.0) for p in inner_2d
+        )
+        inner_upper_perim = mesh.add_xyz_batch(
+            (p.x, p.y, inner_h) for p in inner_2d
+        )
+        self.base_perim = base_perim
+        self.upper_perim = upper_perim
+        self.inner_base_perim = inner_base_perim
+        self.inner_upper_perim = inner_upper_perim
+
+        # Create the outer wall faces
+        for idx in range(len(base_perim)):
+            # Add the vertical outer wall
+            mesh.add_quad(
+                base_perim[idx],
+                upper_perim[idx],
+                upper_perim[idx - 1],
+                base_perim[idx - 1],
             )
 
             # Mark the outer edges to be beveled
-            self.beveler.bevel_edge(
-                self.base_perim[idx], self.upper_perim[idx]
-            )
-            self.beveler.bevel_edge(
-                self.upper_perim[idx], self.upper_perim[idx - 1]
-            )
+            self.beveler.bevel_edge(base_perim[idx], upper_perim[idx])
+            self.beveler.bevel_edge(upper_perim[idx], upper_perim[idx - 1])
 
         # Create the inner wall faces
-        for idx in range(len(self.base_perim)):
-            p = self.inner_base_perim[idx].point
+        for idx in range(len(base_perim)):
             # Inner wall
-            self.mesh.add_quad(
-                self.inner_base_perim[idx],
-                self.inner_base_perim[idx - 1],
-                self.inner_upper_perim[idx - 1],
-                self.inner_upper_perim[idx],
+            mesh.add_quad(
+                inner_base_perim[idx],
+                inner_base_perim[idx - 1],
+                inner_upper_perim[idx - 1],
+                inner_upper_perim[idx],
             )
             # Bottom wall
-            self.mesh.add_quad(
-                self.inner_base_perim[idx],
-                self.base_perim[idx],
-                self.base_perim[idx - 1],
-                self.inner_base_perim[idx - 1],
+            mesh.add_quad(
+                inner_base_perim[idx],
+                base_perim[idx],
+                base_perim[idx - 1],
+                inner_base_perim[idx - 1],
             )
 
         # Inner ceiling
-        self.mesh.add_fan(
-            self.inner_upper_perim[0], reversed(self.inner_upper_perim[1:])
-        )
+        mesh.add_fan(inner_upper_perim[0], reversed(inner_upper_perim[1:]))
         # Top faces
-        self.mesh.add_fan(self.upper_perim[0], self.upper_perim[1:])
+        mesh.add_fan(upper_perim[0], upper_perim[1:])
 
     def apply_display_cutout(self, obj: bpy.types.Object) -> None:
         # The bottom corners of the wall that we will apply the cutout to
@@ -143,13 +129,14 @@ class CustomBox:
         # Apply the display cutout to the diagonal wall
         cutout1 = blender_util.range_cube((-10, 10), (-10, 10), (25, 35))
         blender_util.apply_to_wall(cutout1, p0, p1)
-        blender_util.difference(obj, cutout1)
 
         cutout2 = blender_util.range_cube(
             (-15, 15), (self.wall_thickness * -0.5, 10), (20, 40)
         )
         blender_util.apply_to_wall(cutout2, p0, p1)
-        blender_util.difference(obj, cutout2)
+
+        # Subtract both cutouts with a single boolean operation
+        blender_util.difference(obj, [cutout1, cutout2])
 
     def gen_obj(self) -> bpy.types.Object:
         # Create the main blender object
@@ -3,10 +3,10 @@
 # Copyright (c) 2023, Adam Simpkins
 #
 
-from bpycad import blender_util
+from bpycad import blender_util, cad
 import bpy
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 def simple_display_holder() -> bpy.types.Object:
@@ -23,7 +23,7 @@ def simple_display_holder() -> bpy.types.Object:
     # 4-channel 5V relay module
     pad.add_screw_rect(x=68, y=113, w=45, h=68)
 
-    return pad.obj
+    return pad.finalize()
 
 
 class PcbHolder:
@@ -38,8 +38,37 @@ class PcbHolder:
         self.obj: bpy.types.Object = blender_util.range_cube(
             (0.0, self.w), (0.0, self.h), (0, self.base_thickness)
         )
+
+        # Objects to be added to or subtracted from self.obj.  These are
+        # accumulated and applied together by finalize(), so that we perform
+        # one union and one difference operation for the whole holder, rather
+        # than two boolean operations per standoff.
+        self._pending_add: List[bpy.types.Object] = []
+        self._pending_sub: List[bpy.types.Object] = []
+
+        # Most of the cylinders we create have the same dimensions, so each
+        # distinct cylinder mesh is created once and shared by all objects
+        # that use it.  Each object is positioned with its location rather
+        # than by modifying the shared mesh.
+        self._cylinder_meshes: Dict[
+            Tuple[float, float, float], bpy.types.Mesh
+        ] = {}
+
         self.add_board_connectors()
 
+    def finalize(self) -> bpy.types.Object:
+        """Apply all pending standoffs and connectors to self.obj.
+
+        Returns self.obj.
+        """
+        if self._pending_add:
+            blender_util.union(self.obj, self._pending_add)
+            self._pending_add = []
+        if self._pending_sub:
+            blender_util.difference(self.obj, self._pending_sub)
+            self._pending_sub = []
+        return self.obj
+
     def add_board_connectors(self) -> None:
         # Add protrusions on the left and right that match the protrusions on
         # mini-breadboards allowing them to be hooked together.
@@ -53,21 +82,38 @@ class PcbHolder:
             y += y_offsets[off_idx]
             off_idx = (off_idx + 1) % len(y_offsets)
 
+    def _cylinder_at(
+        self, x: float, y: float, r: float, h: Tuple[float, float]
+    ) -> bpy.types.Object:
+        """Create a vertical cylinder object centered at (x, y)."""
+        key = (r, h[0], h[1])
+        mesh = self._cylinder_meshes.get(key)
+        if mesh is None:
+            mesh = blender_util.blender_mesh(
+                "cylinder_mesh", cad.cylinder(r, h)
+            )
+            self._cylinder_meshes[key] = mesh
+        obj = blender_util.new_mesh_obj("cylinder", mesh, select=False)
+        obj.location = (x, y, 0.0)
+        return obj
+
     def _add_connector(self, x: float, y: float) -> None:
-        cyl = blender_util.cylinder(
-            self.connector_r - 0.05, (0, self.connector_h - 0.4)
+        cyl = self._cylinder_at(
+            x - (2.00 * 0.5),
+            y,
+            self.connector_r - 0.05,
+            (0, self.connector_h - 0.4),
         )
-        with blender_util.TransformContext(cyl) as ctx:
-            ctx.translate(x - (2.00 * 0.5), y, 0)
-        blender_util.union(self.obj, cyl)
+        self._pending_add.append(cyl)
 
     def _add_connector_hole(self, x: float, y: float) -> None:
-        cyl = blender_util.cylinder(
-            self.connector_r + 0.07, (-0.5, self.connector_h + 0.4)
+        cyl = self._cylinder_at(
+            x - 0.95,
+            y,
+            self.connector_r + 0.07,
+            (-0.5, self.connector_h + 0.4),
         )
-        with blender_util.TransformContext(cyl) as ctx:
-            ctx.translate(x - 0.95, y, 0)
-        blender_util.difference(self.obj, cyl)
+        self._pending_sub.append(cyl)
 
     def add_standoff(
         self,
@@ -92,23 +138,23 @@ class PcbHolder:
             screw_depth = min(max(h, 8.0), h + self.base_thickness - 1.0)
 
         intersect_depth = 1
-        standoff = blender_util.cylinder(
+        standoff = self._cylinder_at(
+            x,
+            y,
             r=standoff_r,
             h=(self.base_thickness - intersect_depth, self.base_thickness + h),
         )
-        hole = blender_util.cylinder(
+        hole = self._cylinder_at(
+            x,
+            y,
             r=thread_r,
             h=(
                 self.base_thickness + h - screw_depth,
                 self.base_thickness + h + intersect_depth,
             ),
         )
-        with blender_util.TransformContext(standoff) as ctx:
-            ctx.translate(x, y, 0)
-        with blender_util.TransformContext(hole) as ctx:
-            ctx.translate(x, y, 0)
-        blender_util.union(self.obj, standoff)
-        blender_util.difference(self.obj, hole)
+        self._pending_add.append(standoff)
+        self._pending_sub.append(hole)
 
     def add_screw_rect(
         self, x: float, y: float, w: float, h: float, thread: float = 2.5
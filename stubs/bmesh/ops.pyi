@@ -42,7 +42,7 @@ def transform(
 
 def triangulate(
     bm: bmesh.types.BMesh,
-    faces: _typing.List[bmesh.types.BMFace] = ...,
+    faces: _typing.List[bmesh.types.BMFace] | bmesh.types.BMFaceSeq = ...,
     quad_method: str = ...,
     ngon_method: str = ...,
 ) -> _typing.Dict[str, _typing.Any]: ...
@@ -74,7 +74,7 @@ def delete(
 
 def reverse_faces(
     bm: bmesh.types.BMesh,
-    faces: _typing.List[bmesh.types.BMFace] = ...,
+    faces: _typing.List[bmesh.types.BMFace] | bmesh.types.BMFaceSeq = ...,
     flip_multires: bool = False,
 ) -> None: ...
 
@@ -95,3 +95,20 @@ def convex_hull(
     ] = ...,
     use_existing_faces: bool = ...,
 ) -> _typing.Dict[str, _typing.Any]: ...
+
+
+def remove_doubles(
+    bm: bmesh.types.BMesh,
+    verts: _typing.List[bmesh.types.BMVert] | bmesh.types.BMVertSeq = ...,
+    dist: float = ...,
+) -> None: ...
+
+
+def dissolve_limit(
+    bm: bmesh.types.BMesh,
+    angle_limit: float = ...,
+    use_dissolve_boundaries: bool = ...,
+    verts: _typing.List[bmesh.types.BMVert] | bmesh.types.BMVertSeq = ...,
+    edges: _typing.List[bmesh.types.BMEdge] | bmesh.types.BMEdgeSeq = ...,
+    delimit: _typing.Set[str] = ...,
+) -> _typing.Dict[str, _typing.Any]: ...
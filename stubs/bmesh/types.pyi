@@ -19,6 +19,7 @@ class BMesh:
         shape_key_index: int = 0,
     ) -> None: ...
     def to_mesh(self, mesh: bpy.types.Mesh) -> None: ...
+    def clear(self) -> None: ...
     def free(self) -> None: ...
 
 
@@ -1,3 +1,3 @@
-from . import types
+from . import app, types
 
 data: types.BlendData = ...
@@ -0,0 +1,3 @@
+background: bool = ...
+version: tuple[int, int, int] = ...
+binary_path: str = ...
@@ -1,7 +1,16 @@
 import bpy
+import typing as _typing
 
 
 active_object: bpy.types.Object = ...
 object: bpy.types.Object = ...
 workspace: bpy.types.WorkSpace = ...
 collection: bpy.types.Collection = ...
+mode: str = ...
+selected_objects: _typing.List[bpy.types.Object] = ...
+preferences: bpy.types.Preferences = ...
+scene: bpy.types.Scene = ...
+view_layer: bpy.types.ViewLayer = ...
+
+
+def evaluated_depsgraph_get() -> bpy.types.Depsgraph: ...
@@ -11,24 +11,45 @@ IdT = _typing.TypeVar("IdT", bound=ID)
 class bpy_struct:
     # pyre-fixme[2,3]: shouldn't use Any
     def get(self, key: str, default: _typing.Any = None) -> _typing.Any: ...
+    # pyre-fixme[2]: shouldn't use Any
+    def __setitem__(self, key: str, value: _typing.Any) -> None: ...
 
 
 class ID(bpy_struct):
     name: str = ...
+    users: int = ...
+    use_fake_user: bool = ...
 
     def copy(self: IdT) -> IdT: ...
 
 
 class bpy_prop_collection(bpy_struct, _typing.Sequence[T]):
     def __getitem__(self, key: int | str) -> T: ...
+    def get(self, key: str) -> _typing.Optional[T]: ...
+    def foreach_get(
+        self,
+        attr: str,
+        seq: _typing.Any,  # pyre-fixme[2]: shouldn't use Any
+    ) -> None: ...
+    def foreach_set(
+        self,
+        attr: str,
+        seq: _typing.Any,  # pyre-fixme[2]: shouldn't use Any
+    ) -> None: ...
+
+
+class ViewLayer(bpy_struct):
+    objects: LayerObjects = ...
 
 
-class ViewLayer(bpy_struct): ...
+class LayerObjects(bpy_prop_collection[Object]):
+    active: _typing.Optional[Object] = ...
 
 
 class Object(ID):
     data: ID
     modifiers: ObjectModifiers
+    matrix_world: mathutils.Matrix
 
     @property
     def location(self) -> mathutils.Vector: ...
@@ -47,15 +68,31 @@ class Object(ID):
     def select_set(
         self, state: bool, view_layer: _typing.Optional[ViewLayer] = None
     ) -> None: ...
+    def evaluated_get(self, depsgraph: Depsgraph) -> Object: ...
+    def to_mesh(
+        self,
+        preserve_all_data_layers: bool = False,
+        depsgraph: _typing.Optional[Depsgraph] = None,
+    ) -> Mesh: ...
+    def to_mesh_clear(self) -> None: ...
 
 
 class Mesh(ID):
+    vertices: MeshVertices = ...
     edges: MeshEdges = ...
+    loops: MeshLoops = ...
+    polygons: MeshPolygons = ...
+    loop_triangles: MeshLoopTriangles = ...
     attributes: AttributeGroup = ...
+    shape_keys: _typing.Optional[Key] = ...
 
     def update(
         self, calc_edges: bool = False, calc_edges_loose: bool = False
     ) -> None: ...
+    def transform(
+        self, matrix: mathutils.Matrix, shape_keys: bool = False
+    ) -> None: ...
+    def calc_loop_triangles(self) -> None: ...
     def from_pydata(
         self,
         vertices: _typing.Any,  # pyre-fixme[2]: shouldn't use Any
@@ -65,16 +102,29 @@ class Mesh(ID):
 
 
 class Operator(bpy_struct):
+    properties: OperatorProperties = ...
+
     def report(self, type: _typing.Set[str], message: str) -> None: ...
 
 
-class OperatorProperties(bpy_struct): ...
+class OperatorProperties(bpy_struct):
+    def is_property_set(self, property: str, ghost: bool = True) -> bool: ...
 
 
 class Context(bpy_struct):
     window: Window = ...
     window_manager: WindowManager = ...
 
+    def evaluated_depsgraph_get(self) -> Depsgraph: ...
+
+
+class Preferences(bpy_struct):
+    edit: PreferencesEdit = ...
+
+
+class PreferencesEdit(bpy_struct):
+    use_global_undo: bool = ...
+
 
 class WorkSpace(ID):
     screens: bpy_prop_collection[Screen] = ...
@@ -128,11 +178,27 @@ class BlendData(bpy_struct):
     curves: BlendDataCurves = ...
     fonts: BlendDataFonts = ...
 
+    def batch_remove(self, ids: _typing.Sequence[ID]) -> None: ...
+    def orphans_purge(
+        self,
+        do_local_ids: bool = True,
+        do_linked_ids: bool = True,
+        do_recursive: bool = False,
+    ) -> int: ...
+
 
 class Collection(ID):
     objects: CollectionObjects = ...
 
 
+class Key(ID):
+    pass
+
+
+class Scene(ID):
+    objects: bpy_prop_collection[Object] = ...
+
+
 class Screen(ID):
     areas: bpy_prop_collection[Area] = ...
 
@@ -163,6 +229,13 @@ class BlendDataScreens(bpy_prop_collection[Screen]): ...
 
 class BlendDataMeshes(bpy_prop_collection[Mesh]):
     def new(self, name: str) -> Mesh: ...
+    def remove(
+        self,
+        mesh: Mesh,
+        do_unlink: bool = True,
+        do_id_user: bool = True,
+        do_ui_user: bool = True,
+    ) -> None: ...
     def new_from_object(
         self,
         object: Object,
@@ -185,7 +258,8 @@ class BlendDataObjects(bpy_prop_collection[Object]):
     ) -> None: ...
 
 
-class BlendDataCollections(bpy_prop_collection[Collection]): ...
+class BlendDataCollections(bpy_prop_collection[Collection]):
+    def new(self, name: str) -> Collection: ...
 
 
 class BlendDataCurves(bpy_prop_collection[Curve]):
@@ -202,7 +276,17 @@ class AttributeGroup(bpy_prop_collection[Attribute]):
     def new(self, name: str, type: str, domain: str) -> Attribute: ...
 
 
-class Attribute(bpy_struct): ...
+class Attribute(bpy_struct):
+    data: bpy_prop_collection[_typing.Any] = ...
+
+
+class MeshVertices(bpy_prop_collection[MeshVertex]):
+    def add(self, count: int) -> None: ...
+
+
+class MeshVertex(bpy_struct):
+    co: mathutils.Vector = ...
+    index: int = ...
 
 
 class MeshEdges(bpy_prop_collection[MeshEdge]): ...
@@ -212,6 +296,32 @@ class MeshEdge(bpy_struct):
     vertices: _typing.Tuple[int, int] = ...
 
 
+class MeshLoops(bpy_prop_collection[MeshLoop]):
+    def add(self, count: int) -> None: ...
+
+
+class MeshLoop(bpy_struct):
+    vertex_index: int = ...
+
+
+class MeshPolygons(bpy_prop_collection[MeshPolygon]):
+    def add(self, count: int) -> None: ...
+
+
+class MeshPolygon(bpy_struct):
+    vertices: _typing.Sequence[int] = ...
+    loop_start: int = ...
+    loop_total: int = ...
+
+
+class MeshLoopTriangles(bpy_prop_collection[MeshLoopTriangle]): ...
+
+
+class MeshLoopTriangle(bpy_struct):
+    vertices: _typing.Sequence[int] = ...
+    normal: mathutils.Vector = ...
+
+
 class Curve(ID):
     resolution_u: int
     resolution_v: int
@@ -230,6 +340,7 @@ class VectorFont(ID): ...
 
 class ObjectModifiers(bpy_prop_collection[Modifier]):
     def new(self, name: str, type: str) -> Modifier: ...
+    def remove(self, modifier: Modifier) -> None: ...
 
 
 class Modifier(bpy_struct):
@@ -238,6 +349,8 @@ class Modifier(bpy_struct):
 
 class BooleanModifier(Modifier):
     object: Object = ...
+    collection: Collection = ...
+    operand_type: str = ...
     operation: str = ...
     double_threshold: float = ...
 
@@ -11,9 +11,27 @@ class Matrix(_typing.Sequence[Vector]):
     def Rotation(
         cls, angle: float, size: int, axis: str | Vector = ...
     ) -> Matrix: ...
+    @classmethod
+    def Translation(
+        cls, vector: Vector | _typing.Sequence[float]
+    ) -> Matrix: ...
+    @classmethod
+    def Diagonal(cls, vector: Vector | _typing.Sequence[float]) -> Matrix: ...
+    @classmethod
+    def Identity(cls, size: int) -> Matrix: ...
+
+    @property
+    def translation(self) -> Vector: ...
+    @property
+    def is_negative(self) -> bool: ...
+    def inverted(self) -> Matrix: ...
+    def copy(self) -> Matrix: ...
 
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> Vector: ...
+    def __setitem__(
+        self, index: int, value: Vector | _typing.Sequence[float]
+    ) -> None: ...
 
     @_typing.overload
     def __matmul__(self, value: Matrix) -> Matrix: ...
@@ -35,6 +53,7 @@ class Vector(_typing.Sequence[float]):
     def __init__(self, rows: _typing.Sequence[float]) -> None: ...
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> float: ...
+    def __neg__(self) -> Vector: ...
 
 
 class Quaternion: ...